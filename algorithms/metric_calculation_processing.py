@@ -544,38 +544,44 @@ class MetricCalculationProcessing(QgsProcessingAlgorithm):
         else:
             feedback.pushInfo("induction_areasにデータがありません。hypothetical_residential_areasをレイヤパネルに追加します。")
 
-        for layer_name, alias in required_layers.items():
-            # キャンセルチェック
-            if feedback.isCanceled():
-                return
-
-            QApplication.processEvents()
+        # 一括読み込みの間はレイヤごとのInfoログを出力しない（進捗はfeedbackに出力）
+        before_verbose = before_gpkg_manager.verbose
+        before_gpkg_manager.verbose = False
+        try:
+            for layer_name, alias in required_layers.items():
+                # キャンセルチェック
+                if feedback.isCanceled():
+                    return
 
-            # レイヤパネルに追加するかどうかを判定
-            show_in_panel = True
-
-            # 誘導区域レイヤ、または仮想居住誘導区域レイヤのレイヤパネルへの追加
-            if layer_name == 'induction_areas':
-                # induction_areasにデータがない場合は、レイヤパネルに追加しない
-                if not has_induction_data:
-                    show_in_panel = False
-            elif layer_name == 'hypothetical_residential_areas':
-                # induction_areasにデータがある場合は、レイヤパネルに追加しない
-                if has_induction_data:
-                    show_in_panel = False
-
-            if show_in_panel:
-                # 変更前GPKGから読み込み（layers_to_addリストに追加）
-                layer = before_gpkg_manager.load_layer(layer_name, alias, withload_project=True)
                 QApplication.processEvents()
 
-                if layer and layer.isValid():
-                    feedback.pushInfo(f"レイヤパネル追加リストに登録: {alias}")
-                else:
-                    # レイヤが存在しない場合はエラー
-                    error_msg = f"変更前のGeoPackageに必要なレイヤが不足しています。（不足レイヤ: {alias}）"
-                    feedback.reportError(error_msg)
-                    raise QgsProcessingException(error_msg)
+                # レイヤパネルに追加するかどうかを判定
+                show_in_panel = True
+
+                # 誘導区域レイヤ、または仮想居住誘導区域レイヤのレイヤパネルへの追加
+                if layer_name == 'induction_areas':
+                    # induction_areasにデータがない場合は、レイヤパネルに追加しない
+                    if not has_induction_data:
+                        show_in_panel = False
+                elif layer_name == 'hypothetical_residential_areas':
+                    # induction_areasにデータがある場合は、レイヤパネルに追加しない
+                    if has_induction_data:
+                        show_in_panel = False
+
+                if show_in_panel:
+                    # 変更前GPKGから読み込み（layers_to_addリストに追加）
+                    layer = before_gpkg_manager.load_layer(layer_name, alias, withload_project=True)
+                    QApplication.processEvents()
+
+                    if layer and layer.isValid():
+                        feedback.pushInfo(f"レイヤパネル追加リストに登録: {alias}")
+                    else:
+                        # レイヤが存在しない場合はエラー
+                        error_msg = f"変更前のGeoPackageに必要なレイヤが不足しています。（不足レイヤ: {alias}）"
+                        feedback.reportError(error_msg)
+                        raise QgsProcessingException(error_msg)
+        finally:
+            before_gpkg_manager.verbose = before_verbose
 
         feedback.pushInfo("レイヤの読み込みが完了しました")
 
@@ -634,50 +640,59 @@ class MetricCalculationProcessing(QgsProcessingAlgorithm):
         else:
             feedback.pushInfo("induction_areasにデータがありません。hypothetical_residential_areasをレイヤパネルに追加します。")
 
-        for layer_name, alias in required_layers.items():
-            # キャンセルチェック
-            if feedback.isCanceled():
-                return
-
-            QApplication.processEvents()
-
-            # レイヤパネルに追加するかどうかを判定
-            # population_target_settingsレイヤは追加しない
-            show_in_panel = layer_name != 'population_target_settings'
-
-            # 誘導区域レイヤ、または仮想居住誘導区域レイヤのレイヤパネルへの追加
-            if layer_name == 'induction_areas':
-                # induction_areasにデータがない場合は、レイヤパネルに追加しない
-                if not has_induction_data:
-                    show_in_panel = False
-            elif layer_name == 'hypothetical_residential_areas':
-                # induction_areasにデータがある場合は、レイヤパネルに追加しない
-                if has_induction_data:
-                    show_in_panel = False
-
-            # 変更前GPKGから読み込み
-            layer = before_gpkg_manager.load_layer(layer_name, alias, withload_project=show_in_panel)
-            QApplication.processEvents()
+        # 一括コピーの間はレイヤごとのInfoログを出力しない（進捗はfeedbackに出力）
+        before_verbose = before_gpkg_manager.verbose
+        after_verbose = after_gpkg_manager.verbose
+        before_gpkg_manager.verbose = False
+        after_gpkg_manager.verbose = False
+        try:
+            for layer_name, alias in required_layers.items():
+                # キャンセルチェック
+                if feedback.isCanceled():
+                    return
 
-            if layer and layer.isValid():
-                if show_in_panel:
-                    feedback.pushInfo(f"レイヤパネルに追加: {alias}")
                 QApplication.processEvents()
 
-                # 変更後GPKGにコピー（レイヤパネルには追加しない）
-                result = after_gpkg_manager.add_layer(layer, layer_name, alias, withload_project=False)
+                # レイヤパネルに追加するかどうかを判定
+                # population_target_settingsレイヤは追加しない
+                show_in_panel = layer_name != 'population_target_settings'
+
+                # 誘導区域レイヤ、または仮想居住誘導区域レイヤのレイヤパネルへの追加
+                if layer_name == 'induction_areas':
+                    # induction_areasにデータがない場合は、レイヤパネルに追加しない
+                    if not has_induction_data:
+                        show_in_panel = False
+                elif layer_name == 'hypothetical_residential_areas':
+                    # induction_areasにデータがある場合は、レイヤパネルに追加しない
+                    if has_induction_data:
+                        show_in_panel = False
+
+                # 変更前GPKGから読み込み
+                layer = before_gpkg_manager.load_layer(layer_name, alias, withload_project=show_in_panel)
                 QApplication.processEvents()
 
-                if result:
-                    feedback.pushInfo(f"変更後GPKGにコピー: {alias}")
+                if layer and layer.isValid():
+                    if show_in_panel:
+                        feedback.pushInfo(f"レイヤパネルに追加: {alias}")
+                    QApplication.processEvents()
+
+                    # 変更後GPKGにコピー（レイヤパネルには追加しない）
+                    result = after_gpkg_manager.add_layer(layer, layer_name, alias, withload_project=False)
+                    QApplication.processEvents()
+
+                    if result:
+                        feedback.pushInfo(f"変更後GPKGにコピー: {alias}")
+                    else:
+                        error_msg = f"変更後GeoPackageへのレイヤコピーに失敗しました: {alias}"
+                        feedback.reportError(error_msg)
+                        raise QgsProcessingException(error_msg)
                 else:
-                    error_msg = f"変更後GeoPackageへのレイヤコピーに失敗しました: {alias}"
+                    # レイヤが存在しない場合はエラー
+                    error_msg = f"変更前のGeoPackageに必要なレイヤが不足しています。先に変更前の算出を行ってください。（不足レイヤ: {alias}）"
                     feedback.reportError(error_msg)
                     raise QgsProcessingException(error_msg)
-            else:
-                # レイヤが存在しない場合はエラー
-                error_msg = f"変更前のGeoPackageに必要なレイヤが不足しています。先に変更前の算出を行ってください。（不足レイヤ: {alias}）"
-                feedback.reportError(error_msg)
-                raise QgsProcessingException(error_msg)
+        finally:
+            before_gpkg_manager.verbose = before_verbose
+            after_gpkg_manager.verbose = after_verbose
 
         feedback.pushInfo("レイヤの読み込みとコピーが完了しました")
@@ -22,19 +22,20 @@ class ExcelReaderHelper(QObject):
         super().__init__()
         self._result = None
 
-    @pyqtSlot(str, str)
-    def read_excel_sync(self, filepath, engine):
+    @pyqtSlot(str, str, 'PyQt_PyObject')
+    def read_excel_sync(self, filepath, engine, options=None):
         """メインスレッドでExcelを読み込む
 
         Args:
             filepath: Excelファイルのパス
             engine: pandasのengine ('openpyxl', 'xlrd', or '')
+            options: pd.read_excelに渡す追加引数（usecols, dtype, header）
         """
         try:
+            kwargs = dict(options or {})
             if engine and engine != '':
-                data = pd.read_excel(filepath, sheet_name=None, engine=engine)
-            else:
-                data = pd.read_excel(filepath, sheet_name=None)
+                kwargs['engine'] = engine
+            data = pd.read_excel(filepath, sheet_name=None, **kwargs)
 
             # ガベージコレクション実行
             import gc
@@ -71,16 +72,25 @@ class ExcelReader:
             if app:
                 ExcelReader._helper.moveToThread(app.thread())
 
-    def read_excel(self, filepath, engine=None):
+    def read_excel(self, filepath, engine=None, usecols=None, dtype=None, header=0):
         """メインスレッドでExcelファイルを読み込む
 
         Args:
             filepath: Excelファイルのパス
             engine: pandasのengine ('openpyxl', 'xlrd', or None)
+            usecols: 読み込む列（pd.read_excelのusecols）
+            dtype: 列ごとの型（pd.read_excelのdtype）
+            header: ヘッダー行（pd.read_excelのheader）
 
         Returns:
             読み込んだデータ、またはNone
         """
+        options = {'header': header}
+        if usecols is not None:
+            options['usecols'] = usecols
+        if dtype is not None:
+            options['dtype'] = dtype
+
         try:
             # 現在のスレッドがメインスレッドかチェック
             current_thread = QThread.currentThread()
@@ -98,7 +108,7 @@ class ExcelReader:
             if current_thread == main_thread:
                 # 既にメインスレッドにいる場合は直接実行
                 ExcelReader._helper._result = None
-                ExcelReader._helper.read_excel_sync(filepath, engine or '')
+                ExcelReader._helper.read_excel_sync(filepath, engine or '', options)
                 return ExcelReader._helper._result
             else:
                 # ワーカースレッドからメインスレッドを呼び出す
@@ -120,7 +130,8 @@ class ExcelReader:
                     "read_excel_sync",
                     Qt.QueuedConnection,
                     Q_ARG(str, filepath),
-                    Q_ARG(str, engine or '')
+                    Q_ARG(str, engine or ''),
+                    Q_ARG('PyQt_PyObject', options)
                 )
 
                 # 結果を待つ
@@ -10,15 +10,14 @@ import os
 import re
 import chardet
 import json
-import processing
 from qgis.core import (
     QgsMessageLog,
     Qgis,
     QgsVectorLayer,
     QgsField,
     QgsFeature,
+    QgsFeatureRequest,
     QgsCoordinateReferenceSystem,
-    QgsCoordinateTransform,
     QgsCoordinateTransformContext,
 )
 from PyQt5.QtCore import QCoreApplication, QVariant
@@ -46,6 +45,9 @@ class FacilityDataGenerator:
 
         self.check_canceled = check_canceled_callback
 
+        # 座標変換コンテキスト（読み込み時の再投影で共有）
+        self._tc_ctx = QgsCoordinateTransformContext()
+
     def tr(self, message):
         """翻訳用のメソッド"""
         return QCoreApplication.translate(self.__class__.__name__, message)
@@ -168,6 +170,7 @@ class FacilityDataGenerator:
         provider = facility_layer.dataProvider()
         provider.addAttributes(fields)
         facility_layer.updateFields()
+        out_fields = facility_layer.fields()
 
         # レイヤの編集を開始
         facility_layer.startEditing()
@@ -180,7 +183,8 @@ class FacilityDataGenerator:
             if self.check_canceled():
                 return  # キャンセルチェック
 
-            # 元のレイヤのCRSを確認し、必要ならレイヤ全体を変換
+            # 元のレイヤのCRSを確認し、必要なら読み込み時に座標変換
+            request = QgsFeatureRequest()
             source_crs = layer.crs()
             if source_crs != target_crs:
                 msg = self.tr(
@@ -190,28 +194,22 @@ class FacilityDataGenerator:
                 ).replace("%3", layer.name())
                 QgsMessageLog.logMessage(msg, self.tr("Plugin"), Qgis.Info)
 
-                # レイヤ全体をCRS変換
-                reprojected_result = processing.run(
-                    "native:reprojectlayer",
-                    {
-                        'INPUT': layer,
-                        'TARGET_CRS': target_crs,
-                        'OUTPUT': 'memory:'
-                    }
-                )
-                layer = reprojected_result['OUTPUT']
+                request.setDestinationCrs(target_crs, self._tc_ctx)
 
-            for feature in layer.getFeatures():
-                new_feature = QgsFeature()
-                new_feature.setGeometry(feature.geometry())
-                new_feature.setFields(facility_layer.fields())
+            # フィールド情報はレイヤ単位で一度だけ取得
+            field_names = layer.fields().names()
+            welfare_idx = layer.fields().indexFromName("P14_005")
+            new_features = []
+
+            for feature in layer.getFeatures(request):
+                values = feature.attributes()
 
                 # 介護・福祉機能はP14_005属性で子育て(4)/福祉(5)を判別、なければ全件福祉(5)
                 # 子育て機能は全件子育て(4)として取り込む
                 if file_type == 5:
                     # 介護・福祉機能フォルダの場合
-                    if "P14_005" in feature.fields().names() and feature["P14_005"] is not None:
-                        type_code = self.__get_welfare_type(feature["P14_005"])
+                    if welfare_idx >= 0 and values[welfare_idx] is not None:
+                        type_code = self.__get_welfare_type(values[welfare_idx])
                     else:
                         type_code = 5  # P14_005がなければ福祉機能
                 else:
@@ -219,8 +217,7 @@ class FacilityDataGenerator:
 
                 # すべての属性をJSON形式で保存
                 attributes = {}
-                for field_name in feature.fields().names():
-                    value = feature[field_name]
+                for field_name, value in zip(field_names, values):
                     # QVariantをPython型に変換
                     if value is not None and not isinstance(value, (str, int, float, bool)):
                         value = str(value)
@@ -231,12 +228,15 @@ class FacilityDataGenerator:
                     properties_json = json.dumps(attributes, ensure_ascii=False)
 
                 # フィーチャの属性を設定
-                new_feature.setAttribute("year", year)
-                new_feature.setAttribute("name", "")
-                new_feature.setAttribute("type", type_code)
-                new_feature.setAttribute("address", "")
-                new_feature.setAttribute("properties", properties_json)
-                provider.addFeature(new_feature)
+                new_feature = QgsFeature(out_fields)
+                new_feature.setGeometry(feature.geometry())
+                new_feature.setAttributes(
+                    [year, "", type_code, "", properties_json]
+                )
+                new_features.append(new_feature)
+
+            # レイヤ単位でまとめて追加
+            provider.addFeatures(new_features)
 
         # 編集内容をコミットして保存
         facility_layer.commitChanges()
@@ -7,9 +7,12 @@
 """
 
 import csv
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from qgis.core import QgsMessageLog, Qgis
+from qgis.core import QgsMessageLog, Qgis, QgsFeatureRequest, QgsApplication
 from PyQt5.QtCore import QCoreApplication
 from .gpkg_manager import GpkgManager
 from .excel_reader import ExcelReader
@@ -17,6 +20,26 @@ from .excel_reader import ExcelReader
 
 class FiscalMetricCalculator:
     """財政関連評価指標算出機能"""
+    # 年度ごとの列構造（「合計」列, 課税標準額列）
+    # 2010年: B列（都道府県）、C列（市町村）、F列（合計）、T列（課税標準額）
+    # 2015年: B列（都道府県）、C列（市町村）、F列（合計）、N列（課税標準額）
+    # 2020年: B列（都道府県）、C列（市町村）、D列（合計）、M列（課税標準額）
+    TAX_COLUMNS = {
+        2010: (5, 19),
+        2015: (5, 13),
+        2020: (3, 12),
+    }
+    # 固定資産の価格等の概要調書で使用する文字列列と数値列（課税標準額、全年度の和集合）
+    FIXED_ASSET_DTYPES = {1: str, 2: str, 3: str, 5: str}
+    FIXED_ASSET_VALUE_COLUMNS = frozenset({12, 13, 19})
+    FIXED_ASSET_COLUMNS = frozenset(FIXED_ASSET_DTYPES) | FIXED_ASSET_VALUE_COLUMNS
+    # 市町村別決算状況調で使用する文字列列（P列: 団体名）と数値列（S列: 人口、AO列: 歳出総額）
+    SETTLEMENT_DTYPES = {15: str}
+    SETTLEMENT_VALUE_COLUMNS = frozenset({18, 40})
+    SETTLEMENT_COLUMNS = frozenset(SETTLEMENT_DTYPES) | SETTLEMENT_VALUE_COLUMNS
+    # Parquetキャッシュの保存形式のバージョン（形式を変更した場合は更新）
+    CACHE_FORMAT_VERSION = 2
+
     def __init__(self, input_folder, output_folder, check_canceled_callback=None, gpkg_manager=None, file_suffix=""):
         self.input_folder = input_folder  # Excel読み込み用
         self.output_folder = output_folder  # CSV出力用
@@ -29,6 +52,23 @@ class FiscalMetricCalculator:
         # Excel読み込みヘルパー（メインスレッドで実行）
         self.excel_reader = ExcelReader()
 
+        # 読み込み済みExcelのキャッシュ（(絶対パス, 更新日時) -> データ）
+        self._excel_cache = {}
+
+        # Parquetキャッシュの保存先（入力フォルダには書き込まず、QGISのユーザープロファイル配下に保存）
+        self.cache_dir = os.path.join(
+            QgsApplication.qgisSettingsDirPath(),
+            'cache',
+            'PlateauStatisticsVisualizationPlugin',
+            'fiscal',
+        )
+
+        # 読み込み済み決算データのキャッシュ（年度フォルダの絶対パス -> データ）
+        self._settlement_cache = {}
+
+        # 年度別の歳出総額・人口の集計結果（(年度, 市区町村) -> (データ, 集計値)）
+        self._expenditure_totals_cache = {}
+
     def tr(self, message):
         """翻訳用のメソッド"""
         return QCoreApplication.translate(self.__class__.__name__, message)
@@ -51,21 +91,30 @@ class FiscalMetricCalculator:
                 return
 
             # 対象都道府県・市区町村の組み合わせを取得（重複除去）
-            target_cities_dict = {}
-            for feature in zones_layer.getFeatures():
+            # 属性のみ必要なためジオメトリと不要な列は読み込まない
+            request = QgsFeatureRequest()
+            request.setSubsetOfAttributes(
+                ['is_target', 'prefecture_name', 'name'], zones_layer.fields()
+            )
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+
+            seen = set()
+            target_cities = []
+            for feature in zones_layer.getFeatures(request):
                 if feature["is_target"] == 1:
                     prefecture = feature["prefecture_name"]
                     name = feature["name"]
                     if prefecture and name:
-                        # prefecture+nameをキーにして重複を防ぐ
-                        key = f"{prefecture}_{name}"
-                        if key not in target_cities_dict:
-                            target_cities_dict[key] = {
-                                'prefecture': str(prefecture),
-                                'name': str(name)
-                            }
-
-            target_cities = list(target_cities_dict.values())
+                        # (prefecture, name)で重複を防ぐ
+                        key = (str(prefecture), str(name))
+                        if key not in seen:
+                            seen.add(key)
+                            target_cities.append({
+                                'prefecture': key[0],
+                                'name': key[1],
+                                # 決算状況調の表記（例：栃木県 → 栃　木　県）
+                                'spaced_prefecture': '　'.join(key[0]),
+                            })
 
             if not target_cities:
                 QgsMessageLog.logMessage(
@@ -76,42 +125,27 @@ class FiscalMetricCalculator:
                 self.export_empty_files()
                 return
 
-            # 固定資産税関連データを計算
-            land_tax_data = self.calculate_land_tax_data(target_cities)
+            # 固定資産税データを年度別に一度だけ読み込み
+            fixed_asset_dir = os.path.join(self.input_folder, "25_固定資産の価格等の概要調書")
+            annual_tax_data = self.load_annual_fixed_asset_data(fixed_asset_dir)
+
+            # 固定資産税関連データを計算（年度別税収も併せて取得）
+            land_tax_data = self.calculate_land_tax_data(target_cities, annual_tax_data)
+
+            # 市町村別決算状況調を年度別に一度だけ読み込み
+            settlement_dir = os.path.join(self.input_folder, "26_市町村別決算状況調")
+            annual_settlement_data = self.load_annual_settlement_data(settlement_dir)
 
             # 一人当たり歳出額関連データを計算
-            per_capita_data = self.calculate_per_capita_data(target_cities)
+            per_capita_data = self.calculate_per_capita_data(
+                target_cities, annual_settlement_data
+            )
 
             # 固定資産税データを年度別に出力
             fixed_asset_data_list = []
             if 'latest_year' in land_tax_data and land_tax_data['latest_year'] != '―':
-                # 利用可能な全年度のデータを出力
-                fixed_asset_dir = os.path.join(self.input_folder, "25_固定資産の価格等の概要調書")
-                annual_tax_data = {}
-
-                if os.path.exists(fixed_asset_dir):
-                    for folder_name in os.listdir(fixed_asset_dir):
-                        folder_path = os.path.join(fixed_asset_dir, folder_name)
-                        if os.path.isdir(folder_path) and "年度" in folder_name:
-                            try:
-                                year = int(folder_name.replace("年度", ""))
-                                data = self.read_fixed_asset_data(fixed_asset_dir, folder_name)
-                                if data is not None:
-                                    annual_tax_data[year] = data
-                            except ValueError:
-                                continue
-
-                # 各年度の税収を計算（万円）
-                tax_by_year = {}
-                for year, data in annual_tax_data.items():
-                    total_tax = 0
-                    for city_info in target_cities:
-                        tax_revenue = self.extract_tax_base_amount(data, city_info, year)
-                        if tax_revenue:
-                            total_tax += tax_revenue
-
-                    if total_tax > 0:
-                        tax_by_year[year] = total_tax
+                # 各年度の税収（万円）は算出済みのものを使用
+                tax_by_year = land_tax_data['tax_by_year']
 
                 # 増減率と増減率の差分を計算
                 sorted_years = sorted(tax_by_year.keys())
@@ -140,11 +174,11 @@ class FiscalMetricCalculator:
                         # 年次
                         'year': year,
                         # 固定資産税(土地) 万円
-                        'land_fixed_asset_tax': self.round_or_na(tax_amount, 0),
+                        'land_fixed_asset_tax': round(tax_amount, 0),
                         # 固定資産税(土地)の前年度からの増減率（実数）
-                        'land_fixed_asset_tax_change_rate': self.round_or_na(change_rate, 3) if change_rate != '―' else '―',
+                        'land_fixed_asset_tax_change_rate': round(change_rate, 3) if isinstance(change_rate, float) else '―',
                         # 固定資産税(土地)の増減率の差分（実数）
-                        'land_fixed_asset_tax_change_rate_delta': self.round_or_na(change_rate_delta, 3) if change_rate_delta != '―' else '―',
+                        'land_fixed_asset_tax_change_rate_delta': round(change_rate_delta, 3) if isinstance(change_rate_delta, float) else '―',
                         # 全国平均値
                         'land_fixed_asset_tax_revenue_national_avg': '―',
                         # 都道府県平均値
@@ -167,10 +201,7 @@ class FiscalMetricCalculator:
             # 歳出額データを期間別に出力
             expenditure_data_list = []
 
-
             # 期間別計算（元の実装を使用）
-            settlement_dir = os.path.join(self.input_folder, "26_市町村別決算状況調")
-
             if os.path.exists(settlement_dir):
                 # 期間別計算
                 periods = [
@@ -180,7 +211,8 @@ class FiscalMetricCalculator:
 
                 for period in periods:
                     period_expenditure_data = self.calculate_period_expenditure(
-                        target_cities, settlement_dir, period['years'], period['id'], period['label']
+                        target_cities, settlement_dir, period['years'], period['id'], period['label'],
+                        annual_settlement_data,
                     )
                     if period_expenditure_data:
                         expenditure_data_list.append(period_expenditure_data)
@@ -227,15 +259,16 @@ class FiscalMetricCalculator:
                     expenditure_data_list.append(empty_period_data)
 
             # ファイル分離してエクスポート
-            self.export(
-                os.path.join(self.output_folder, f'IF106_財政関連評価指標_固定資産税ファイル{self.file_suffix}.csv'),
-                fixed_asset_data_list,
-            )
-
-            self.export(
-                os.path.join(self.output_folder, f'IF106_財政関連評価指標_歳出額ファイル{self.file_suffix}.csv'),
-                expenditure_data_list,
-            )
+            self.export_files([
+                (
+                    os.path.join(self.output_folder, f'IF106_財政関連評価指標_固定資産税ファイル{self.file_suffix}.csv'),
+                    fixed_asset_data_list,
+                ),
+                (
+                    os.path.join(self.output_folder, f'IF106_財政関連評価指標_歳出額ファイル{self.file_suffix}.csv'),
+                    expenditure_data_list,
+                ),
+            ])
 
             return
 
@@ -258,14 +291,13 @@ class FiscalMetricCalculator:
             headers = list(data[0].keys())
 
             # CSVファイル書き込み
+            # 行ごとに書き出さず、1MBのバッファにまとめてから書き込む
             with open(
-                file_path, mode='w', newline='', encoding='utf-8'
+                file_path, mode='w', newline='', encoding='utf-8', buffering=1 << 20
             ) as csv_file:
                 writer = csv.DictWriter(csv_file, fieldnames=headers)
                 writer.writeheader()
-
-                for row in data:
-                    writer.writerow(row)
+                writer.writerows(data)
 
             msg = self.tr(
                 "File export completed: %1."
@@ -288,55 +320,54 @@ class FiscalMetricCalculator:
             )
             raise e
 
+    def export_files(self, exports):
+        """複数ファイルを並行してエクスポート
+
+        Args:
+            exports: (出力パス, データ) のリスト
+        """
+        # 書き込みはI/O待ちが主体のためスレッドで並行実行
+        with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+            futures = [
+                executor.submit(self.export, file_path, data)
+                for file_path, data in exports
+            ]
+            # 例外は呼び出し元に伝播させる
+            for future in futures:
+                future.result()
+
     def round_or_na(self, value, decimal_places, threshold=None):
         """丸め処理"""
-        if value is None or (threshold is not None and value <= threshold):
+        if value is None:
+            return '―'
+        # 閾値指定がない場合は比較を省略
+        if threshold is not None and value <= threshold:
             return '―'
-        else:
-            return round(value, decimal_places)
+        return round(value, decimal_places)
 
-    def calculate_land_tax_data(self, target_cities):
+    def calculate_land_tax_data(self, target_cities, annual_tax_data=None):
         """固定資産税(土地)関連データを計算"""
         try:
-            # 固定資産の価格等の概要調書パス
-            fixed_asset_dir = os.path.join(self.input_folder, "25_固定資産の価格等の概要調書")
-
-            # 利用可能な全年度のデータを取得
-            annual_tax_data = {}
-
-            if not os.path.exists(fixed_asset_dir):
-                return {'latest_year': '―', 'latest_tax': '―', 'change_rate': '―'}
-
-            # 年度フォルダを検索
-            for folder_name in os.listdir(fixed_asset_dir):
-                folder_path = os.path.join(fixed_asset_dir, folder_name)
-                if os.path.isdir(folder_path) and "年度" in folder_name:
-                    data = self.read_fixed_asset_data(fixed_asset_dir, folder_name)
-                    if data is not None:
-                        # 年度を抽出（例：2015年度 -> 2015）
-                        try:
-                            year = int(folder_name.replace("年度", ""))
-                            annual_tax_data[year] = data
-                        except ValueError:
-                            continue
+            # 読み込み済みデータがない場合は全年度のデータを取得
+            if annual_tax_data is None:
+                fixed_asset_dir = os.path.join(self.input_folder, "25_固定資産の価格等の概要調書")
+                annual_tax_data = self.load_annual_fixed_asset_data(fixed_asset_dir)
 
             if len(annual_tax_data) < 1:
-                return {'latest_year': '―', 'latest_tax': '―', 'change_rate': '―'}
+                return {'latest_year': '―', 'latest_tax': '―', 'change_rate': '―', 'tax_by_year': {}}
 
             # 各年度の固定資産税収を計算（万円）
             tax_by_year = {}
+            city_keys = {(city_info['prefecture'], city_info['name']) for city_info in target_cities}
             for year, data in annual_tax_data.items():
-                total_tax = 0
-                for city_info in target_cities:
-                    tax_revenue = self.extract_tax_base_amount(data, city_info, year)
-                    if tax_revenue:
-                        total_tax += tax_revenue
+                tax_index = self.build_tax_index(data, year, city_keys)
+                total_tax = self.sum_tax_by_cities(tax_index, target_cities)
 
                 if total_tax > 0:
                     tax_by_year[year] = total_tax
 
             if len(tax_by_year) == 0:
-                return {'latest_year': '―', 'latest_tax': '―', 'change_rate': '―'}
+                return {'latest_year': '―', 'latest_tax': '―', 'change_rate': '―', 'tax_by_year': {}}
 
             # 最新年度のデータを取得
             sorted_years = sorted(tax_by_year.keys())
@@ -355,7 +386,9 @@ class FiscalMetricCalculator:
             result = {
                 'latest_year': latest_year,
                 'latest_tax': self.round_or_na(latest_tax, 3),
-                'change_rate': change_rate
+                'change_rate': change_rate,
+                # 年度別の固定資産税収（万円）
+                'tax_by_year': tax_by_year,
             }
 
             return result
@@ -366,23 +399,244 @@ class FiscalMetricCalculator:
                 self.tr("Plugin"),
                 Qgis.Warning,
             )
-            return {'latest_year': '―', 'latest_tax': '―', 'change_rate': '―'}
+            return {'latest_year': '―', 'latest_tax': '―', 'change_rate': '―', 'tax_by_year': {}}
+
+    def find_year_folders(self, base_dir, target_years=None):
+        """年度フォルダを検索し、(年度, フォルダ名) を年度順に返す"""
+        year_folders = []
+
+        if not os.path.isdir(base_dir):
+            return year_folders
+
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if "年度" not in entry.name or not entry.is_dir():
+                    continue
+                # 年度を抽出（例：2015年度 -> 2015、前後の空白・全角数字も可）
+                try:
+                    year = int(entry.name.replace("年度", ""))
+                except ValueError:
+                    QgsMessageLog.logMessage(
+                        self.tr("Skipping folder %1: the year could not be determined.")
+                        .replace("%1", entry.path),
+                        self.tr("Plugin"),
+                        Qgis.Warning,
+                    )
+                    continue
+                if target_years is None or year in target_years:
+                    year_folders.append((year, entry.name))
+
+        return sorted(year_folders)
+
+    def load_annual_fixed_asset_data(self, fixed_asset_dir):
+        """固定資産の価格等の概要調書を年度別に読み込み"""
+        annual_tax_data = {}
+        for year, folder_name in self.find_year_folders(fixed_asset_dir):
+            data = self.read_fixed_asset_data(fixed_asset_dir, folder_name)
+            if data is not None:
+                annual_tax_data[year] = data
+
+        return annual_tax_data
+
+    def load_annual_settlement_data(self, settlement_dir, target_years=None):
+        """市町村別決算状況調を年度別に読み込み"""
+        year_folders = self.find_year_folders(settlement_dir, target_years)
+        self.__prefetch_parquet_caches(
+            settlement_dir, year_folders, self.SETTLEMENT_COLUMNS, self.SETTLEMENT_DTYPES
+        )
+
+        annual_data = {}
+        for year, folder_name in year_folders:
+            data = self.read_settlement_data(settlement_dir, folder_name, year)
+            if data is not None:
+                annual_data[year] = data
+
+        return annual_data
+
+    def __prefetch_parquet_caches(self, base_dir, year_folders, columns, dtype):
+        """年度フォルダごとのParquetキャッシュを並列に先読み
+
+        Parquetの読み込みはGILを解放するためスレッドで並列化できる。
+        Excelの解析はメインスレッドで行う必要があるため、キャッシュがない年度は
+        従来どおり呼び出し元で逐次読み込む。
+        """
+        def prefetch(folder_name):
+            year_dir = os.path.join(base_dir, folder_name)
+            if not os.path.isdir(year_dir):
+                return
+            for filepath in self.__find_excel_files(year_dir):
+                key = (os.path.abspath(filepath), os.path.getmtime(filepath))
+                if key in self._excel_cache:
+                    return
+                data = self.__read_parquet_cache(filepath, columns, dtype)
+                if data:
+                    self._excel_cache[key] = data
+                    return
+
+        if len(year_folders) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(year_folders))) as executor:
+            for future in [executor.submit(prefetch, folder_name) for _, folder_name in year_folders]:
+                try:
+                    future.result()
+                except Exception as e:
+                    QgsMessageLog.logMessage(
+                        self.tr("Failed to prefetch cache: %1").replace("%1", str(e)),
+                        self.tr("Plugin"),
+                        Qgis.Warning,
+                    )
+
+    def read_excel_cached(self, filepath, engine=None, columns=None, dtype=None):
+        """Excelを読み込み（同一ファイルは再解析しない）
+
+        ヘッダー行を使わずに読み込むため、列ラベルはシート上の列位置（0始まり）となる。
+        columnsを指定した場合はその列のみを読み込み、解析結果をプラグインのキャッシュフォルダに
+        Parquet形式で保存して次回以降の読み込みに利用する。
+        """
+        key = (os.path.abspath(filepath), os.path.getmtime(filepath))
+        if key in self._excel_cache:
+            return self._excel_cache[key]
+
+        data = None
+        if columns is not None:
+            data = self.__read_parquet_cache(filepath, columns, dtype or {})
+
+        if data is None:
+            usecols = (lambda col: col in columns) if columns is not None else None
+            data = self.excel_reader.read_excel(
+                filepath, engine, usecols=usecols, dtype=dtype, header=None
+            )
+            if data and columns is not None:
+                data = {
+                    sheet_name: self.__normalize_sheet(df, dtype or {})
+                    for sheet_name, df in data.items()
+                }
+                self.__write_parquet_cache(filepath, columns, dtype or {}, data)
+
+        self._excel_cache[key] = data
+        return data
+
+    def __normalize_sheet(self, df, dtype):
+        """文字列列をカテゴリ型、数値列（読み込む列のうち文字列列以外）を数値に変換
+
+        数値列は数値のセルのみ値とし、それ以外（数字の文字列を含む）はNaNとなるため、
+        索引作成時の型判定や再変換が不要になる。
+        Parquet保存のためにも列の型を揃えておく。
+        """
+        df = df.copy()
+        for col in df.columns:
+            if col in dtype:
+                df[col] = df[col].astype('string').astype('category')
+            else:
+                df[col] = self.__to_numeric(df[col])
+        return df
+
+    def __cache_path(self, filepath, columns, dtype):
+        """ExcelファイルのParquetキャッシュのパスを取得
+
+        ファイル名は元ファイルの絶対パスと、読み込む列・列の型・保存形式のバージョン（署名）から作成する。
+        署名が変わった場合は別のファイルとなるため、古い条件で保存したキャッシュは使用しない。
+        """
+        signature = repr((
+            self.CACHE_FORMAT_VERSION,
+            sorted(columns),
+            sorted((col, getattr(col_type, '__name__', str(col_type))) for col, col_type in dtype.items()),
+        ))
+        source_key = hashlib.sha1(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+        signature_key = hashlib.sha1(signature.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f'{source_key}_{signature_key}.parquet')
+
+    def __read_parquet_cache(self, filepath, columns, dtype):
+        """Excelより新しく、読み込み条件が同じParquetキャッシュがあれば読み込む"""
+        cache_path = self.__cache_path(filepath, columns, dtype)
+        try:
+            if (not os.path.exists(cache_path) or
+                    os.path.getmtime(cache_path) < os.path.getmtime(filepath)):
+                return None
+
+            cached = pd.read_parquet(cache_path)
+            data = {}
+            for sheet_name, df in cached.groupby('sheet_name', sort=False):
+                df = df.drop(columns='sheet_name').reset_index(drop=True)
+                df.columns = [int(col) for col in df.columns]
+                # シート連結時に失われたカテゴリ型を復元
+                data[sheet_name] = self.__normalize_sheet(df, dtype)
+            return data
+        except ImportError:
+            # Parquetエンジン（pyarrow等）がない環境ではキャッシュを使わない
+            return None
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                self.tr("Failed to read cache %1: %2").replace("%1", cache_path).replace("%2", str(e)),
+                self.tr("Plugin"),
+                Qgis.Warning,
+            )
+            return None
+
+    def __write_parquet_cache(self, filepath, columns, dtype, data):
+        """全シートをsheet_name列付きで連結し、Parquetキャッシュとして保存"""
+        cache_path = self.__cache_path(filepath, columns, dtype)
+        try:
+            frames = []
+            for sheet_name, df in data.items():
+                df = df.copy()
+                df.columns = [str(col) for col in df.columns]
+                df['sheet_name'] = sheet_name
+                frames.append(df)
+            if not frames:
+                return
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pd.concat(frames, ignore_index=True).to_parquet(
+                cache_path, compression='zstd', index=False
+            )
+
+            # 同じファイルを別の署名で保存した古いキャッシュを削除
+            source_prefix = os.path.basename(cache_path).split('_', 1)[0] + '_'
+            with os.scandir(self.cache_dir) as entries:
+                stale_paths = [
+                    entry.path
+                    for entry in entries
+                    if entry.name.startswith(source_prefix) and entry.path != cache_path
+                ]
+            for stale_path in stale_paths:
+                os.remove(stale_path)
+        except ImportError:
+            # Parquetエンジン（pyarrow等）がない環境ではキャッシュを使わない
+            return
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                self.tr("Failed to write cache %1: %2").replace("%1", cache_path).replace("%2", str(e)),
+                self.tr("Plugin"),
+                Qgis.Warning,
+            )
+
+    def __find_excel_files(self, directory):
+        """ディレクトリ直下のExcelファイルのパスを取得（一時ファイルを除外）"""
+        with os.scandir(directory) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.name.lower().endswith(('.xlsx', '.xls'))
+                and not entry.name.startswith('~$')
+                and entry.is_file()
+            ]
 
     def read_fixed_asset_data(self, base_dir, year_folder):
         """固定資産の価格等の概要調書を読み込み"""
         try:
             year_dir = os.path.join(base_dir, year_folder)
-            if not os.path.exists(year_dir):
+            if not os.path.isdir(year_dir):
                 return None
 
-            # Excelファイルを検索
-            for filename in os.listdir(year_dir):
-                if filename.endswith(('.xlsx', '.xls')):
-                    filepath = os.path.join(year_dir, filename)
-                    # メインスレッドでExcelを読み込み
-                    data = self.excel_reader.read_excel(filepath, None)
-                    if data:
-                        return data
+            # Excelファイルを検索（一時ファイルを除外）
+            for filepath in self.__find_excel_files(year_dir):
+                # メインスレッドでExcelを読み込み
+                data = self.read_excel_cached(
+                    filepath, None, self.FIXED_ASSET_COLUMNS, self.FIXED_ASSET_DTYPES
+                )
+                if data:
+                    return data
 
             return None
         except Exception as e:
@@ -393,123 +647,95 @@ class FiscalMetricCalculator:
             )
             return None
 
-    def extract_tax_base_amount(self, excel_data, city_info, year):
-        """都道府県・市区町村名から課税標準額を抽出し、固定資産税収（万円）で計算"""
+    def build_tax_index(self, excel_data, year, target_keys=None):
+        """ワークブック全体から固定資産税収（万円）の索引を作成
+
+        Args:
+            excel_data: シート名 -> DataFrame
+            year: 年度
+            target_keys: 対象の (都道府県名, 市区町村名) の集合。すべて見つかった時点で走査を終了
+
+        Returns:
+            {(都道府県名, 市区町村名): 固定資産税収（万円）}
+        """
+        tax_index = {}
         try:
             if not excel_data:
-                return 0
+                return tax_index
 
-            prefecture_name = city_info['prefecture']
-            name = city_info['name']
-
-            # 年度に応じた列構造を設定
-            # 2010年: B列（都道府県）、C列（市町村）、F列（合計）、T列（課税標準額）
-            # 2015年: B列（都道府県）、C列（市町村）、F列（合計）、N列（課税標準額）
-            # 2020年: B列（都道府県）、C列（市町村）、D列（合計）、M列（課税標準額）
-
-            if year == 2010:
-                total_col_idx = 5   # F列
-                tax_col_idx = 19    # T列（課税標準額）
-            elif year == 2015:
-                total_col_idx = 5   # F列
-                tax_col_idx = 13    # N列（課税標準額）
-            elif year == 2020:
-                total_col_idx = 3   # D列
-                tax_col_idx = 12    # M列（課税標準額）
-            else:
-                # 未知の年度の場合はスキップ
-                return 0
+            # 未知の年度の場合はスキップ
+            if year not in self.TAX_COLUMNS:
+                return tax_index
 
-            # 全シートから該当市町村を検索
+            total_col_idx, tax_col_idx = self.TAX_COLUMNS[year]
+
+            # ワークブックのシート順に1回ずつ走査（先に見つかったシート・行を優先）
+            # シート順に走査するため、対象がすべて見つかった後のシートで対象の値が変わることはない
             for df in excel_data.values():
+                if target_keys and target_keys <= tax_index.keys():
+                    break
                 if df is None or df.empty:
                     continue
+                if not {1, 2, total_col_idx, tax_col_idx}.issubset(df.columns):
+                    continue
 
-                # 行ごとに検索
-                for _, row in df.iterrows():
-                    try:
-                        # B列（index=1）とC列（index=2）で市町村を確認
-                        if len(row) > 2:
-                            pref_col = row.iloc[1] if hasattr(row, 'iloc') else row[1]
-                            city_col = row.iloc[2] if hasattr(row, 'iloc') else row[2]
-
-                            # 都道府県と市区町村名が一致するか確認
-                            if (pd.notna(pref_col) and pd.notna(city_col) and
-                                str(pref_col) == prefecture_name and str(city_col) == name):
-
-                                # 年度に応じた「合計」列をチェック
-                                is_total_row = False
-                                if len(row) > total_col_idx:
-                                    total_col = row.iloc[total_col_idx] if hasattr(row, 'iloc') else row[total_col_idx]
-                                    if pd.notna(total_col) and str(total_col) == '合計':
-                                        is_total_row = True
-
-                                if is_total_row:
-                                    # 課税標準額を取得
-                                    tax_base = 0
-
-                                    if len(row) > tax_col_idx:
-                                        tax_col = row.iloc[tax_col_idx] if hasattr(row, 'iloc') else row[tax_col_idx]
-                                        if pd.notna(tax_col) and isinstance(tax_col, (int, float)):
-                                            tax_base = float(tax_col)
-
-                                    # 固定資産税収を計算（万円）
-                                    if tax_base > 0:
-                                        tax_revenue = (tax_base * 0.014) / 10  # 千円→万円
-                                        return tax_revenue
-                    except:
-                        continue
-
-            return 0
+                # B列（1）とC列（2）、年度に応じた「合計」列をまとめて判定
+                pref_series = self.__categorical_column(df[1])
+                city_series = self.__categorical_column(df[2])
+                total_series = self.__categorical_column(df[total_col_idx])
+                tax_base = self.__to_numeric(df[tax_col_idx])
+                mask = (
+                    pref_series.notna()
+                    & city_series.notna()
+                    & total_series.eq('合計')
+                    & (tax_base > 0)
+                ).fillna(False)
+
+                # 固定資産税収を計算（万円）
+                tax_revenue = (tax_base[mask] * 0.014) / 10  # 千円→万円
+                for key, value in zip(
+                    zip(pref_series[mask], city_series[mask]), tax_revenue
+                ):
+                    if key not in tax_index:
+                        tax_index[key] = float(value)
+
+            return tax_index
         except Exception as e:
             QgsMessageLog.logMessage(
                 self.tr("Error extracting tax base: %1").replace("%1", str(e)),
                 self.tr("Plugin"),
                 Qgis.Warning,
             )
-            return 0
+            return tax_index
+
+    def sum_tax_by_cities(self, tax_index, target_cities):
+        """対象市区町村の固定資産税収（万円）を合計"""
+        tax_values = np.fromiter(
+            (tax_index.get((city_info['prefecture'], city_info['name']), 0)
+             for city_info in target_cities),
+            dtype=np.float64,
+            count=len(target_cities),
+        )
+        return float(tax_values.sum())
 
-    def calculate_per_capita_data(self, target_cities):
+    def extract_tax_base_amount(self, excel_data, city_info, year):
+        """都道府県・市区町村名から課税標準額を抽出し、固定資産税収（万円）で計算"""
+        tax_index = self.build_tax_index(excel_data, year)
+        return tax_index.get((city_info['prefecture'], city_info['name']), 0)
+
+    def calculate_per_capita_data(self, target_cities, annual_data=None):
         """一人当たり歳出額関連データを計算"""
         try:
-            # 市町村別決算状況調パス
-            settlement_dir = os.path.join(self.input_folder, "26_市町村別決算状況調")
-
-            if not os.path.exists(settlement_dir):
-                return {'latest_per_capita': '―', 'recent_avg_change': '―'}
-
-            # 利用可能な全年度のデータを読み込み
-            annual_data = {}
-
-            for folder_name in os.listdir(settlement_dir):
-                folder_path = os.path.join(settlement_dir, folder_name)
-                if os.path.isdir(folder_path) and "年度" in folder_name:
-                    try:
-                        year = int(folder_name.replace("年度", ""))
-                        data = self.read_settlement_data(settlement_dir, folder_name, year)
-                        if data is not None:
-                            annual_data[year] = data
-                    except ValueError:
-                        continue
+            # 読み込み済みデータがない場合は利用可能な全年度のデータを読み込み
+            if annual_data is None:
+                settlement_dir = os.path.join(self.input_folder, "26_市町村別決算状況調")
+                annual_data = self.load_annual_settlement_data(settlement_dir)
 
             if len(annual_data) < 1:
                 return {'latest_per_capita': '―', 'recent_avg_change': '―'}
 
             # 各年の一人当たり歳出額を計算
-            per_capita_by_year = {}
-
-            for year, data in annual_data.items():
-                total_expenditure = 0
-                total_population = 0
-
-                for city_info in target_cities:
-                    exp, pop = self.extract_expenditure_population(data, city_info)
-                    total_expenditure += exp
-                    total_population += pop
-
-
-                if total_population > 0:
-                    per_capita_by_year[year] = total_expenditure / total_population
+            per_capita_by_year = self.per_capita_by_year(target_cities, annual_data).to_dict()
 
             if len(per_capita_by_year) == 0:
                 return {'latest_per_capita': '―', 'recent_avg_change': '―'}
@@ -573,35 +799,42 @@ class FiscalMetricCalculator:
             return {'latest_per_capita': '―', 'recent_avg_change': '―'}
 
     def read_settlement_data(self, base_dir, year_folder, year):
-        """市町村別決算状況調を読み込み"""
+        """市町村別決算状況調を読み込み（同一年度フォルダは再検索しない）"""
+        key = os.path.abspath(os.path.join(base_dir, year_folder))
+        if key not in self._settlement_cache:
+            self._settlement_cache[key] = self.__read_settlement_data(base_dir, year_folder)
+        return self._settlement_cache[key]
+
+    def __read_settlement_data(self, base_dir, year_folder):
+        """市町村別決算状況調を年度フォルダから読み込み"""
         try:
             year_dir = os.path.join(base_dir, year_folder)
-            if not os.path.exists(year_dir):
+            if not os.path.isdir(year_dir):
                 return None
 
             # Excelファイルを検索（一時ファイルを除外）
-            for filename in os.listdir(year_dir):
-                if (filename.endswith(('.xlsx', '.xls', '.XLS')) and
-                    not filename.startswith('~$')):
-                    filepath = os.path.join(year_dir, filename)
-                    try:
-                        # ファイル拡張子に応じてエンジンを指定
-                        if filename.endswith('.xlsx'):
-                            engine = 'openpyxl'
-                        else:
-                            engine = 'xlrd'
-
-                        # メインスレッドでExcelを読み込み
-                        data = self.excel_reader.read_excel(filepath, engine)
-                        if data:
-                            return data
-                    except Exception as file_error:
-                        QgsMessageLog.logMessage(
-                            self.tr("Skipping file {0}: {1}").format(filename, str(file_error)),
-                            self.tr("Plugin"),
-                            Qgis.Warning,
-                        )
-                        continue
+            for filepath in self.__find_excel_files(year_dir):
+                filename = os.path.basename(filepath)
+                try:
+                    # ファイル拡張子に応じてエンジンを指定
+                    if filename.lower().endswith('.xlsx'):
+                        engine = 'openpyxl'
+                    else:
+                        engine = 'xlrd'
+
+                    # メインスレッドでExcelを読み込み
+                    data = self.read_excel_cached(
+                        filepath, engine, self.SETTLEMENT_COLUMNS, self.SETTLEMENT_DTYPES
+                    )
+                    if data:
+                        return data
+                except Exception as file_error:
+                    QgsMessageLog.logMessage(
+                        self.tr("Skipping file {0}: {1}").format(filename, str(file_error)),
+                        self.tr("Plugin"),
+                        Qgis.Warning,
+                    )
+                    continue
 
             return None
         except Exception as e:
@@ -612,81 +845,180 @@ class FiscalMetricCalculator:
             )
             return None
 
-    def extract_expenditure_population(self, excel_data, city_info):
-        """都道府県・市区町村名から歳出総額と人口を抽出"""
-        try:
-            if not excel_data:
-                return 0, 0
-
+    def spaced_prefectures(self, target_cities):
+        """対象都道府県名とスペース区切り表記の対応を取得"""
+        prefectures = {}
+        for city_info in target_cities:
             prefecture_name = city_info['prefecture']
-            name = city_info['name']
+            if prefecture_name not in prefectures:
+                prefectures[prefecture_name] = city_info.get(
+                    'spaced_prefecture', '　'.join(prefecture_name)
+                )
+        return prefectures
 
-            # 都道府県名をスペース区切りに変換（例：栃木県 → 栃　木　県）
-            spaced_prefecture = '　'.join(list(prefecture_name))
+    def build_expenditure_index(self, excel_data, prefectures, target_keys=None):
+        """ワークブック全体から歳出総額と人口の索引を作成
 
+        Args:
+            excel_data: シート名 -> DataFrame
+            prefectures: 対象都道府県名 -> スペース区切りの都道府県名
+            target_keys: 対象の (都道府県名, 市区町村名) の集合。すべて見つかった時点で走査を終了
 
-            # 全シートから該当市町村を検索
+        Returns:
+            {(都道府県名, 市区町村名): (歳出総額, 人口)}
+        """
+        expenditure_index = {}
+        try:
+            if not excel_data:
+                return expenditure_index
+
+            # ワークブックのシート順に1回ずつ走査（先に見つかったシート・行を優先）
+            # シート順に走査するため、対象がすべて見つかった後のシートで対象の値が変わることはない
             for df in excel_data.values():
+                if target_keys and target_keys <= expenditure_index.keys():
+                    break
                 if df is None or df.empty:
                     continue
 
-                # 2段階検索：1) 都道府県を探す 2) その後の市区町村を探す
-                in_target_prefecture = False
-
-                for row_idx, row in df.iterrows():
-                    try:
-                        # P列（index=15）をチェック
-                        if len(row) > 15:
-                            p_col = row.iloc[15] if hasattr(row, 'iloc') else row[15]
-                            p_col_text = str(p_col).strip() if pd.notna(p_col) else ""
-
-                            # 1段階目：都道府県を探す
-                            if p_col_text == spaced_prefecture:
-                                in_target_prefecture = True
-                                continue
-
-                            # 都道府県内でない場合はスキップ
-                            if not in_target_prefecture:
-                                continue
-
-                            # 「合　　　計」が来たら都道府県セクション終了
-                            if "合" in p_col_text and "計" in p_col_text:
-                                in_target_prefecture = False
-                                continue
-
-                            # 2段階目：目標市区町村を探す
-                            if p_col_text == name:
-
-                                # 人口と歳出総額を列インデックスで取得
-                                # S列（人口）= index 18
-                                # AO列（歳出総額）= index 40
-                                population = 0
-                                expenditure = 0
-
-                                # S列から人口を取得
-                                if len(row) > 18:
-                                    pop_col = row.iloc[18] if hasattr(row, 'iloc') else row[18]
-                                    if pd.notna(pop_col) and isinstance(pop_col, (int, float)):
-                                        population = float(pop_col)
-
-                                # AO列から歳出総額を取得
-                                if len(row) > 40:
-                                    exp_col = row.iloc[40] if hasattr(row, 'iloc') else row[40]
-                                    if pd.notna(exp_col) and isinstance(exp_col, (int, float)):
-                                        expenditure = float(exp_col)
-
-                                return expenditure, population
-                    except:
-                        continue
-
-            return 0, 0
+                # P列（15）をチェック
+                if 15 not in df.columns:
+                    continue
+
+                p_text = self.__categorical_column(
+                    df[15].astype('string').str.strip().fillna('')
+                )
+
+                # 「合」「計」の判定はカテゴリ（ユニークな値）単位で行う
+                categories = p_text.cat.categories.astype(str)
+                end_categories = categories[
+                    categories.str.contains('合') & categories.str.contains('計')
+                ]
+                is_end = p_text.isin(end_categories)
+
+                # 人口と歳出総額を列インデックスで取得
+                # S列（人口）= 18
+                # AO列（歳出総額）= 40
+                population = self.__numeric_column(df, 18)
+                expenditure = self.__numeric_column(df, 40)
+
+                for prefecture_name, spaced_prefecture in prefectures.items():
+                    # 都道府県の開始行（1）と「合　　　計」による終了行（0）を区切りとして、
+                    # 区切り以外の行に直前の区切りを伝播させて都道府県セクションを判定
+                    is_start = p_text.eq(spaced_prefecture)
+                    marker = is_start.astype(float).where(is_start | is_end)
+                    in_target_prefecture = marker.ffill().fillna(0).eq(1)
+                    rows = marker.isna() & in_target_prefecture
+
+                    for name, exp, pop in zip(
+                        p_text[rows], expenditure[rows], population[rows]
+                    ):
+                        expenditure_index.setdefault(
+                            (prefecture_name, name), (exp, pop)
+                        )
+
+            return expenditure_index
         except Exception as e:
             QgsMessageLog.logMessage(
                 self.tr("Error extracting expenditure/population: %1").replace("%1", str(e)),
                 self.tr("Plugin"),
                 Qgis.Warning,
             )
-            return 0, 0
+            return expenditure_index
+
+    def __categorical_column(self, series):
+        """文字列列をカテゴリ型に変換（一致判定を整数コードの比較にする）"""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series
+        return series.astype('string').astype('category')
+
+    def __numeric_column(self, df, col_idx):
+        """指定列を数値に変換（列がない・数値でない場合は0）"""
+        if col_idx not in df.columns:
+            return pd.Series(0.0, index=df.index)
+        return self.__to_numeric(df[col_idx]).fillna(0).astype(float)
+
+    def __to_numeric(self, series):
+        """数値列に変換（読み込み時に変換済みの列はそのまま使用）
+
+        数値のセルのみ値とし、数字の文字列等の数値以外のセルはNaNとする。
+        """
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            return series
+        is_number = series.map(lambda value: isinstance(value, (int, float)))
+        return pd.to_numeric(series.where(is_number), errors='coerce')
+
+    def extract_expenditure_population_batch(self, expenditure_index, city_keys):
+        """索引に存在する市区町村の歳出総額と人口をそれぞれ配列で取得"""
+        found = list(expenditure_index.keys() & city_keys)
+        expenditures = np.fromiter(
+            (expenditure_index[key][0] for key in found), dtype=np.float64, count=len(found)
+        )
+        populations = np.fromiter(
+            (expenditure_index[key][1] for key in found), dtype=np.float64, count=len(found)
+        )
+        return expenditures, populations
+
+    def sum_expenditure_by_cities(self, expenditure_index, city_keys):
+        """対象市区町村の歳出総額と人口を合計（索引に存在する市区町村のみ集計）"""
+        expenditures, populations = self.extract_expenditure_population_batch(
+            expenditure_index, city_keys
+        )
+        return float(expenditures.sum()), float(populations.sum())
+
+    def expenditure_totals_by_year(self, target_cities, annual_data):
+        """年度ごとに対象市区町村の歳出総額と人口の合計を集計
+
+        同じ年度・市区町村の組み合わせは期間ごとの集計で繰り返し使われるため、
+        集計結果を保持して再利用する。
+
+        Returns:
+            年度をインデックスとし、expenditure・population列を持つDataFrame
+        """
+        prefectures = self.spaced_prefectures(target_cities)
+        city_keys = frozenset((city_info['prefecture'], city_info['name']) for city_info in target_cities)
+
+        totals = []
+        for year, data in annual_data.items():
+            cached = self._expenditure_totals_cache.get((year, city_keys))
+            if cached is None or cached[0] is not data:
+                expenditure_index = self.build_expenditure_index(data, prefectures, city_keys)
+
+                # 決算データに見つからない市区町村を年度ごとに通知
+                missing = city_keys - expenditure_index.keys()
+                if missing:
+                    QgsMessageLog.logMessage(
+                        self.tr("Settlement data not found for %1 in %2").replace(
+                            "%1", ", ".join(f"{pref}{city}" for pref, city in sorted(missing))
+                        ).replace("%2", str(year)),
+                        self.tr("Plugin"),
+                        Qgis.Info,
+                    )
+
+                cached = (data, self.sum_expenditure_by_cities(expenditure_index, city_keys))
+                self._expenditure_totals_cache[(year, city_keys)] = cached
+            totals.append(cached[1])
+
+        return pd.DataFrame(
+            totals,
+            index=pd.Index(list(annual_data), name='year'),
+            columns=['expenditure', 'population'],
+            dtype=np.float64,
+        )
+
+    def per_capita_by_year(self, target_cities, annual_data):
+        """年度ごとの一人当たり歳出額を計算（人口が0の年度は除外）"""
+        totals = self.expenditure_totals_by_year(target_cities, annual_data)
+        totals = totals[totals['population'] > 0]
+        return totals['expenditure'] / totals['population']
+
+    def extract_expenditure_population(self, excel_data, city_info):
+        """都道府県・市区町村名から歳出総額と人口を抽出"""
+        expenditure_index = self.build_expenditure_index(
+            excel_data, self.spaced_prefectures([city_info])
+        )
+        return expenditure_index.get(
+            (city_info['prefecture'], city_info['name']), (0, 0)
+        )
 
     def export_empty_files(self):
         """空のデータを2つのファイルに出力"""
@@ -743,57 +1075,45 @@ class FiscalMetricCalculator:
         ]
 
         # 2つのファイルに分離してエクスポート
-        self.export(
-            os.path.join(self.output_folder, f'IF106_財政関連評価指標_固定資産税ファイル{self.file_suffix}.csv'),
-            [empty_fixed_asset_data],
-        )
-
-        self.export(
-            os.path.join(self.output_folder, f'IF106_財政関連評価指標_歳出額ファイル{self.file_suffix}.csv'),
-            empty_expenditure_data_list,
-        )
+        self.export_files([
+            (
+                os.path.join(self.output_folder, f'IF106_財政関連評価指標_固定資産税ファイル{self.file_suffix}.csv'),
+                [empty_fixed_asset_data],
+            ),
+            (
+                os.path.join(self.output_folder, f'IF106_財政関連評価指標_歳出額ファイル{self.file_suffix}.csv'),
+                empty_expenditure_data_list,
+            ),
+        ])
 
-    def calculate_period_expenditure(self, target_cities, settlement_dir, target_years, period_id, period_label):
+    def calculate_period_expenditure(self, target_cities, settlement_dir, target_years, period_id, period_label,
+                                     annual_settlement_data=None):
         """固定期間の歳出額データを計算"""
         try:
-            # 対象年度のデータを読み込み
-            annual_data = {}
-            for year in target_years:
-                year_folder = f"{year}年度"
-                data = self.read_settlement_data(settlement_dir, year_folder, year)
-                if data is not None:
-                    annual_data[year] = data
+            # 対象年度のデータを取得（読み込み済みデータがあれば再利用）
+            if annual_settlement_data is None:
+                annual_data = self.load_annual_settlement_data(settlement_dir, target_years)
+            else:
+                annual_data = {
+                    year: annual_settlement_data[year]
+                    for year in target_years
+                    if year in annual_settlement_data
+                }
 
             if len(annual_data) < 1:
                 return None
 
-            # 各年の一人当たり歳出額を計算
-            per_capita_by_year = {}
-            for year, data in annual_data.items():
-                total_expenditure = 0
-                total_population = 0
+            # 各年の一人当たり歳出額を計算（集計済みの年度は再利用）
+            per_capita = self.per_capita_by_year(target_cities, annual_data).to_numpy()
 
-                for city_info in target_cities:
-                    exp, pop = self.extract_expenditure_population(data, city_info)
-                    total_expenditure += exp
-                    total_population += pop
-
-                if total_population > 0:
-                    per_capita_by_year[year] = total_expenditure / total_population
-
-            if len(per_capita_by_year) < 1:
+            if per_capita.size < 1:
                 return None
 
-            # 期間内の一人当たり歳出額の平均値を計算
-            avg_per_capita = '―'
-            if len(per_capita_by_year) > 0:
-                avg_per_capita = self.round_or_na(sum(per_capita_by_year.values()) / len(per_capita_by_year), 1)
-
-            # 期間内の一人当たり歳出額の合計を計算
-            total_per_capita = '―'
-            if len(per_capita_by_year) > 0:
-                total_per_capita = self.round_or_na(sum(per_capita_by_year.values()), 0)
-
+            # 期間内の一人当たり歳出額の合計・平均値を1回の集計で計算
+            # （丸め結果を従来と一致させるため、fsumではなく年度順の逐次加算で合計）
+            per_capita_sum = sum(per_capita.tolist())
+            total_per_capita = self.round_or_na(per_capita_sum, 0)
+            avg_per_capita = self.round_or_na(per_capita_sum / per_capita.size, 1)
 
             return {
                 # 期間ID（連番）
@@ -13,9 +13,10 @@ from qgis.core import (
     QgsMessageLog,
     Qgis,
     QgsProject,
+    QgsLayerTreeLayer,
     QgsCoordinateTransformContext,
 )
-from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtCore import QCoreApplication, QT_TR_NOOP
 from osgeo import ogr
 
 
@@ -26,48 +27,114 @@ class GpkgManager:
         self,
         base_path,
         gpkg_name="PlateauStatisticsVisualizationPlugin.gpkg",
+        verbose=True,
     ):
-        """初期化"""
+        """初期化
+
+        Args:
+            base_path: GeoPackageを配置するディレクトリ
+            gpkg_name: GeoPackageのファイル名
+            verbose: Falseの場合はInfoレベルのログを出力しない
+        """
         self.base_path = base_path
         self.gpkg_name = gpkg_name
         self.geopackage_path = os.path.join(base_path, gpkg_name)
+        # レイヤの存在チェック用に正規化したパス
+        self._geopackage_path_norm = os.path.normpath(self.geopackage_path)
         # プロジェクトに追加すべきレイヤ情報を保持するリスト
         self.layers_to_add = []
+        self.verbose = verbose
+        # ログのタグ（翻訳済み）
+        self._plugin_tag = self.tr("Plugin")
+        # このインスタンスで書き込んだレイヤ名
+        self._authored_layers = set()
 
     def tr(self, message):
         """翻訳用のメソッド"""
         return QCoreApplication.translate("GpkgManager", message)
 
+    def _tr_fmt(self, text, *args):
+        """翻訳済みの文字列の%1, %2, ...を引数で置換"""
+        for i, arg in enumerate(args, 1):
+            text = text.replace(f"%{i}", str(arg))
+        return text
+
+    def _log_info(self, text, *args):
+        """Infoレベルのログを出力
+
+        textは翻訳前の文字列（QT_TR_NOOPで翻訳対象として登録）を受け取り、
+        verbose=Falseの場合は翻訳と文字列の組み立ても省略する。
+        """
+        if self.verbose:
+            QgsMessageLog.logMessage(
+                self._tr_fmt(self.tr(text), *args), self._plugin_tag, Qgis.Info
+            )
+
+    def _layer_options(self, layer_name):
+        """レイヤ読み込みオプションを取得
+
+        このインスタンスで書き込んだレイヤはスタイルを保存していないため、
+        GeoPackage内の既定スタイルの検索を省略する。
+        """
+        options = QgsVectorLayer.LayerOptions()
+        options.loadDefaultStyle = layer_name not in self._authored_layers
+        return options
+
+    def _is_our_layer(self, layer):
+        """レイヤのソースがこのGeoPackageかを判定"""
+        try:
+            source = layer.source()
+        except (AttributeError, RuntimeError):
+            return False
+
+        # ファイル名を含まないソースはパスの正規化を行わずに除外
+        if self.gpkg_name not in source:
+            return False
+
+        path = source.split("|", 1)[0]
+        return (
+            path == self.geopackage_path
+            or os.path.normpath(path) == self._geopackage_path_norm
+        )
+
+    def _layer_names(self, gpkg):
+        """開いたOGRデータソースからレイヤ名一覧を取得"""
+        # gpkg_contentsからレイヤ名を一括取得（レイヤごとの初期化を行わない）
+        result = gpkg.ExecuteSQL(
+            "SELECT table_name FROM gpkg_contents ORDER BY table_name"
+        )
+        if result is None:
+            return [
+                gpkg.GetLayerByIndex(i).GetName()
+                for i in range(gpkg.GetLayerCount())
+            ]
+
+        try:
+            return [feature.GetField(0) for feature in result]
+        finally:
+            gpkg.ReleaseResultSet(result)
+
     def make_gpkg(self):
         """GeoPackage作成"""
         try:
             # GeoPackageが存在しない場合、新規作成する
             if not os.path.exists(self.geopackage_path):
-                # 空のレイヤーを作成してGeoPackageを初期化
-                temp_layer = QgsVectorLayer("None", "temp", "memory")
-                options = QgsVectorFileWriter.SaveVectorOptions()
-                options.driverName = "GPKG"
-
-                # GeoPackageの初期化のために一時レイヤーを書き込む
-                error = QgsVectorFileWriter.writeAsVectorFormatV3(
-                    temp_layer,
-                    self.geopackage_path,
-                    QgsCoordinateTransformContext(),
-                    options,
-                )
+                # 空のGeoPackageを作成
+                driver = ogr.GetDriverByName("GPKG")
+                gpkg = driver.CreateDataSource(self.geopackage_path)
 
-                if error[0] != QgsVectorFileWriter.NoError:
+                if gpkg is None:
                     error_message = self.tr(
                         "Failed to create GeoPackage: %1"
-                    ).replace("%1", str(error))
+                    ).replace("%1", self.geopackage_path)
                     raise Exception(error_message)
 
+                gpkg.Close()
+
             # 成功のログ出力
-            QgsMessageLog.logMessage(
-                self.tr("GeoPackage initialization completed. Path: %1")
-                .replace("%1", self.geopackage_path),
-                self.tr("Plugin"),
-                Qgis.Info,
+            self._log_info(
+                QT_TR_NOOP("GeoPackage initialization completed. Path: %1"),
+                self.geopackage_path,
             )
             return self.geopackage_path
 
@@ -75,7 +142,7 @@ class GpkgManager:
             # エラーメッセージのログ出力
             QgsMessageLog.logMessage(
                 self.tr("GeoPackage initialization error: %1").replace("%1", str(e)),
-                self.tr("Plugin"),
+                self._plugin_tag,
                 Qgis.Critical,
             )
             raise Exception(self.tr("Failed to create GeoPackage.")) from e
@@ -89,7 +156,9 @@ class GpkgManager:
                 alias if alias else layer_name
             )  # aliasが指定されていればそれを使用
 
-            gpkg_layer = QgsVectorLayer(uri, display_name, "ogr")
+            gpkg_layer = QgsVectorLayer(
+                uri, display_name, "ogr", self._layer_options(layer_name)
+            )
 
             if not gpkg_layer.isValid():
                 return None
@@ -99,18 +168,14 @@ class GpkgManager:
                     'layer_name': layer_name,
                     'alias': alias
                 })
-                QgsMessageLog.logMessage(
-                    self.tr("GeoPackage layer %1 registered.")
-                    .replace("%1", display_name),
-                    self.tr("Plugin"),
-                    Qgis.Info,
+                self._log_info(
+                    QT_TR_NOOP("GeoPackage layer %1 registered."),
+                    display_name,
                 )
             else:
-                QgsMessageLog.logMessage(
-                    self.tr("GeoPackage layer %1 loaded.")
-                    .replace("%1", layer_name),
-                    self.tr("Plugin"),
-                    Qgis.Info,
+                self._log_info(
+                    QT_TR_NOOP("GeoPackage layer %1 loaded."),
+                    layer_name,
                 )
 
             return gpkg_layer
@@ -119,7 +184,7 @@ class GpkgManager:
             QgsMessageLog.logMessage(
                 self.tr("Error loading GeoPackage layer: %1")
                 .replace("%1", str(e)),
-                self.tr("Plugin"),
+                self._plugin_tag,
                 Qgis.Critical,
             )
             return None
@@ -148,11 +213,10 @@ class GpkgManager:
                     f"{error[1]}"
                 )
 
-            QgsMessageLog.logMessage(
-                self.tr("Layer %1 added to GeoPackage %2.")
-                .replace("%1", layer_name).replace("%2", self.geopackage_path),
-                self.tr("Plugin"),
-                Qgis.Info,
+            self._authored_layers.add(layer_name)
+            self._log_info(
+                QT_TR_NOOP("Layer %1 added to GeoPackage %2."),
+                layer_name, self.geopackage_path,
             )
 
             # レイヤをレイヤパネルへ追加
@@ -161,13 +225,14 @@ class GpkgManager:
         except Exception as e:
             QgsMessageLog.logMessage(
                 self.tr("An error occurred: %1").replace("%1", str(e)),
-                self.tr("Plugin"),
+                self._plugin_tag,
                 Qgis.Critical,
             )
             return False
 
     def delete_layer(self, layer_name):
         """指定したレイヤをGeoPackageから削除"""
+        gpkg = None
         try:
             gpkg = ogr.Open(self.geopackage_path, update=1)
 
@@ -176,37 +241,39 @@ class GpkgManager:
                     f"GeoPackageの読み込みに失敗しました: {self.geopackage_path}"
                 )
 
-            if self.load_layer(layer_name, False) is None:
+            # 開いたハンドルからレイヤの存在を確認
+            if layer_name not in self._layer_names(gpkg):
                 return
 
-            if gpkg.DeleteLayer(layer_name) != 0:
+            result = gpkg.DeleteLayer(layer_name)
+            self._authored_layers.discard(layer_name)
+            if result != 0:
                 msg = self.tr(
                     "Failed to delete layer: %1"
                 ).replace("%1", layer_name)
                 raise Exception(msg)
 
-            QgsMessageLog.logMessage(
-                self.tr("Layer %1 deleted from GeoPackage %2.")
-                .replace("%1", layer_name).replace("%2", self.geopackage_path),
-                self.tr("Plugin"),
-                Qgis.Info,
+            self._log_info(
+                QT_TR_NOOP("Layer %1 deleted from GeoPackage %2."),
+                layer_name, self.geopackage_path,
             )
 
-            gpkg.Close()
             return True
 
         except Exception as e:
             QgsMessageLog.logMessage(
                 self.tr("Error deleting GeoPackage layer: %1").replace("%1", str(e)),
-                self.tr("Plugin"),
+                self._plugin_tag,
                 Qgis.Critical,
             )
             return False
+        finally:
+            # GeoPackageのハンドルを開いたままにしない
+            if gpkg is not None:
+                gpkg.Close()
 
     def get_layers(self):
         """GeoPackage内のレイヤ名一覧を取得する"""
-        layer_names = []
-
         # GeoPackageを開く
         gpkg = ogr.Open(self.geopackage_path)
 
@@ -215,81 +282,79 @@ class GpkgManager:
                 self.tr(
                     "Failed to load GeoPackage: %1"
                 ).replace("%1", self.geopackage_path),
-                self.tr("Plugin"),
+                self._plugin_tag,
                 Qgis.Critical,
             )
             return []
 
-        # レイヤ名を取得
-        for i in range(gpkg.GetLayerCount()):
-            layer = gpkg.GetLayerByIndex(i)
-            layer_names.append(layer.GetName())
-
-        # GeoPackageを明示的に閉じる
-        gpkg.Close()
-
-        return layer_names
+        try:
+            return self._layer_names(gpkg)
+        finally:
+            # GeoPackageのハンドルを開いたままにしない
+            gpkg.Close()
 
     def add_layers_to_project(self):
         """
         保持しているレイヤ情報を使ってプロジェクトにレイヤを追加する
         """
+        project = QgsProject.instance()
+
+        # レイヤパネルに存在するこのGeoPackageのレイヤ名を事前に収集
+        existing_layers = {
+            layer.name()
+            for layer in project.mapLayers().values()
+            if self._is_our_layer(layer)
+        }
+
+        new_layers = []
         for layer_info in self.layers_to_add:
             layer_name = layer_info['layer_name']
             alias = layer_info['alias']
             display_name = alias if alias else layer_name
 
+            # 既にレイヤパネルに同じGeoPackageレイヤが存在するかチェック
+            if display_name in existing_layers:
+                self._log_info(
+                    QT_TR_NOOP("GeoPackage layer %1 already exists. Skipping."),
+                    display_name,
+                )
+                continue
+
             # GeoPackageからレイヤを読み込み
             uri = f"{self.geopackage_path}|layername={layer_name}"
-            gpkg_layer = QgsVectorLayer(uri, display_name, "ogr")
+            gpkg_layer = QgsVectorLayer(
+                uri, display_name, "ogr", self._layer_options(layer_name)
+            )
 
             if not gpkg_layer.isValid():
                 QgsMessageLog.logMessage(
                     self.tr("Failed to load layer %1 from GeoPackage")
                     .replace("%1", display_name),
-                    self.tr("Plugin"),
+                    self._plugin_tag,
                     Qgis.Warning,
                 )
                 continue
 
-            # 既にレイヤパネルに同じGeoPackageレイヤが存在するかチェック
-            project = QgsProject.instance()
-            layer_exists = False
-            for existing_layer in project.mapLayers().values():
-                try:
-                    if (os.path.normpath(existing_layer.source()).startswith(
-                        os.path.normpath(self.geopackage_path)
-                    ) and existing_layer.name() == display_name):
-                        layer_exists = True
-                        QgsMessageLog.logMessage(
-                            self.tr("GeoPackage layer %1 already exists. Skipping.")
-                            .replace("%1", display_name),
-                            self.tr("Plugin"),
-                            Qgis.Info,
-                        )
-                        break
-                except:
-                    continue
-
-            if layer_exists:
-                continue
-
-            # レイヤをプロジェクトに追加
-            added_layer = QgsProject.instance().addMapLayer(
-                gpkg_layer, False
-            )
-
-            # レイヤツリー追加、可視性をオフに設定
-            root = QgsProject.instance().layerTreeRoot()
-            layer_tree_layer = root.insertLayer(0, added_layer)
-            layer_tree_layer.setItemVisibilityChecked(False)
-
-            QgsMessageLog.logMessage(
-                self.tr("GeoPackage layer %1 added to the layer panel.")
-                .replace("%1", display_name),
-                self.tr("Plugin"),
-                Qgis.Info,
-            )
+            existing_layers.add(display_name)
+            new_layers.append(gpkg_layer)
+
+        if new_layers:
+            # レイヤをプロジェクトにまとめて追加
+            added_layers = project.addMapLayers(new_layers, False)
+
+            # レイヤツリー追加（後に追加したレイヤが上）、可視性をオフに設定
+            layer_tree_layers = []
+            for added_layer in reversed(added_layers):
+                layer_tree_layer = QgsLayerTreeLayer(added_layer)
+                layer_tree_layer.setItemVisibilityChecked(False)
+                layer_tree_layers.append(layer_tree_layer)
+            project.layerTreeRoot().insertChildNodes(0, layer_tree_layers)
+
+            for added_layer in added_layers:
+                self._log_info(
+                    QT_TR_NOOP("GeoPackage layer %1 added to the layer panel."),
+                    added_layer.name(),
+                )
 
         # 追加完了後、リストをクリア
         self.layers_to_add = []
@@ -6,21 +6,38 @@
  ***************************************************************************/
 """
 
+import os
 import re
 import csv
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from qgis.core import (
     QgsMessageLog,
     Qgis,
     QgsVectorLayer,
     QgsFeature,
+    QgsFeatureRequest,
+    QgsGeometry,
+    QgsMemoryProviderUtils,
+    QgsProject,
+    QgsSpatialIndex,
 )
-from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtCore import QCoreApplication, QThread
 import processing
 from .gpkg_manager import GpkgManager
 
 
 class LandUseMetricCalculator:
     """土地利用関連評価指標算"""
+
+    # 空間インデックスと準備済みジオメトリで判定する居住誘導区域のフィーチャ数の下限
+    INDUCTION_INDEX_MIN_FEATURES = 100
+    # 区域内外の振り分け時にまとめてレイヤに追加するフィーチャ数
+    PARTITION_BATCH_SIZE = 1024
+    # CSV出力時にまとめて書き込む行数
+    EXPORT_BATCH_SIZE = 8192
+
     def __init__(self, base_path, check_canceled_callback=None, gpkg_manager=None, file_suffix=""):
         self.base_path = base_path
 
@@ -29,6 +46,14 @@ class LandUseMetricCalculator:
         self.gpkg_manager = gpkg_manager
         self.file_suffix = file_suffix
 
+        # 出力ファイルのパス
+        self.output_path = os.path.join(
+            base_path, f'IF105_土地利用関連評価指標ファイル{file_suffix}.csv'
+        )
+
+        # ログのタグ（翻訳済み）
+        self._plugin_tag = self.tr("Plugin")
+
     def tr(self, message):
         """翻訳用のメソッド"""
         return QCoreApplication.translate(self.__class__.__name__, message)
@@ -36,34 +61,8 @@ class LandUseMetricCalculator:
     def calc(self):
         """算出処理"""
         try:
-            # 行政区域
-            zones_layer = self.gpkg_manager.load_layer(
-                'zones', None, withload_project=False
-            )
-            # 変化度マップ
-            change_maps_layer = self.gpkg_manager.load_layer(
-                'change_maps', None, withload_project=False
-            )
-            # 用途地域
-            land_use_areas_layer = self.gpkg_manager.load_layer(
-                'land_use_areas', None, withload_project=False
-            )
-            # 誘導区域
-            induction_layer = self.gpkg_manager.load_layer(
-                'induction_areas', None, withload_project=False
-            )
-            # 土地利用細分化メッシュ
-            land_use_meshes_layer = self.gpkg_manager.load_layer(
-                'land_use_maps', None, withload_project=False
-            )
-            # 都市計画区域
-            urban_plannings_layer = self.gpkg_manager.load_layer(
-                'urban_plannings', None, withload_project=False
-            )
-            # 仮想居住誘導区域
-            hypothetical_residential_layer = self.gpkg_manager.load_layer(
-                'hypothetical_residential_areas', None, withload_project=False
-            )
+            # 必須レイヤ（行政区域、変化度マップ）を並列に読み込み
+            zones_layer, change_maps_layer = self.__load_layers(['zones', 'change_maps'])
 
             # 必須レイヤのチェック
             missing_layers = []
@@ -76,25 +75,29 @@ class LandUseMetricCalculator:
                 QgsMessageLog.logMessage(
                     self.tr("Missing layers: %1. Outputting empty result.")
                     .replace("%1", ", ".join(missing_layers)),
-                    self.tr("Plugin"),
+                    self._plugin_tag,
                     Qgis.Warning,
                 )
                 self.__export_data([])
                 return
 
-            # is_target=1のzonesを抽出
-            target_zones_result = processing.run(
-                "native:extractbyexpression",
-                {
-                    'INPUT': zones_layer,
-                    'EXPRESSION': '"is_target" = 1',
-                    'OUTPUT': 'memory:'
-                }
-            )
-            target_zones_layer = target_zones_result['OUTPUT']
-
-            if target_zones_layer.featureCount() == 0:
-                target_zones_layer = None
+            # 任意レイヤを並列に読み込み
+            (
+                land_use_areas_layer,  # 用途地域
+                induction_layer,  # 誘導区域
+                land_use_meshes_layer,  # 土地利用細分化メッシュ
+                urban_plannings_layer,  # 都市計画区域
+                hypothetical_residential_layer,  # 仮想居住誘導区域
+            ) = self.__load_layers([
+                'land_use_areas',
+                'induction_areas',
+                'land_use_maps',
+                'urban_plannings',
+                'hypothetical_residential_areas',
+            ])
+
+            # is_target=1のzonesに絞り込み
+            target_zones_layer = self.__filter_by_subset(zones_layer, '"is_target" = 1')
 
             # target_zones_layerがない場合は集計を行わない
             if not target_zones_layer:
@@ -104,11 +107,28 @@ class LandUseMetricCalculator:
             # データリストを作成
             data_list = []
 
-            # 工業専用地域を除外した変化度マップを作成
-            # まず行政区域制約を適用
+            # 行政区域の空間インデックスを先に作成（以降の抽出処理で共有するため）
+            processing.run(
+                "native:createspatialindex", {'INPUT': target_zones_layer}
+            )
+
+            # 居住誘導区域（type_id=31）に絞り込み
+            residential_induction_layer = self.__filter_by_subset(
+                induction_layer, '"type_id" = 31'
+            )
+
+            # 行政区域制約を適用した変化度マップ
+            # （行政区域のレイヤは呼び出し元スレッドに属するため、抽出処理は並列にせず順に実行）
             admin_constrained_change_maps = self.__extract_within_zones(
                 change_maps_layer, target_zones_layer
             )
+            # 都市計画区域内の宅地利用メッシュ数
+            residential_land_mesh_count = self.__get_residential_land_mesh_count(
+                land_use_meshes_layer, urban_plannings_layer, target_zones_layer
+            )
+
+            if self.check_canceled and self.check_canceled():
+                return  # キャンセルチェック
 
             # 工業専用地域を除外（land_use_areasがある場合）
             if land_use_areas_layer:
@@ -118,26 +138,17 @@ class LandUseMetricCalculator:
                 )
             else:
                 filtered_change_maps = admin_constrained_change_maps
+            # 中間レイヤを解放
+            del admin_constrained_change_maps
 
-            # 居住誘導区域（type_id=31）を取得、なければ仮想居住誘導区域を使用
+            # 居住誘導区域を取得、なければ仮想居住誘導区域を使用
             has_residential_area = False
             use_hypothetical_areas = False
             residential_area_layer = None
 
-            if induction_layer:
-                residential_induction_result = processing.run(
-                    "native:extractbyexpression",
-                    {
-                        'INPUT': induction_layer,
-                        'EXPRESSION': '"type_id" = 31',
-                        'OUTPUT': 'memory:'
-                    }
-                )
-                residential_induction_layer = residential_induction_result['OUTPUT']
-
-                if residential_induction_layer.featureCount() > 0:
-                    residential_area_layer = residential_induction_layer
-                    has_residential_area = True
+            if residential_induction_layer:
+                residential_area_layer = residential_induction_layer
+                has_residential_area = True
 
             # 居住誘導区域がない場合は仮想居住誘導区域を使用
             if not has_residential_area and hypothetical_residential_layer:
@@ -146,15 +157,10 @@ class LandUseMetricCalculator:
 
                 QgsMessageLog.logMessage(
                     self.tr("No residential induction areas found. Using hypothetical residential areas."),
-                    self.tr("Plugin"),
+                    self._plugin_tag,
                     Qgis.Info,
                 )
 
-            # 都市計画区域内の宅地利用メッシュ数を取得
-            residential_land_mesh_count = self.__get_residential_land_mesh_count(
-                land_use_meshes_layer, urban_plannings_layer, target_zones_layer
-            )
-
             # 新築指数、滅失指数、その他指数を計算
             # 居住誘導区域内外でのそれぞれの指数を算出
 
@@ -167,22 +173,45 @@ class LandUseMetricCalculator:
                     "native:createspatialindex", {'INPUT': residential_area_layer}
                 )
 
-            # 居住誘導区域内の変化度データを取得
-            inside_rpa_change_maps = self.__extract_within_induction_areas(
-                filtered_change_maps, residential_area_layer
+            # 居住誘導区域のフィーチャ数が多い場合は空間インデックスと準備済みジオメトリで判定
+            induction_index = self.__build_induction_index(
+                residential_area_layer, filtered_change_maps.crs()
             )
 
-            # 居住誘導区域外の変化度データを取得
-            outside_rpa_change_maps = self.__extract_outside_induction_areas(
-                filtered_change_maps, residential_area_layer
+            if induction_index is not None:
+                # 居住誘導区域内外を1回の走査で振り分け
+                inside_rpa_change_maps, outside_rpa_change_maps = self.__partition_by_induction_index(
+                    filtered_change_maps, induction_index
+                )
+            else:
+                # 居住誘導区域内外の変化度データを取得
+                inside_rpa_change_maps = self.__extract_within_induction_areas(
+                    filtered_change_maps, residential_area_layer
+                )
+                outside_rpa_change_maps = self.__extract_outside_induction_areas(
+                    filtered_change_maps, residential_area_layer
+                )
+
+            # 中間レイヤを解放
+            del filtered_change_maps, induction_index
+
+            # 区域内外の積算変化度を1回ずつ集計し、指数と積算変化度の両方に使用
+            new_construction_inside_cumulative = self.__get_cumulative_change(
+                inside_rpa_change_maps, 'new_construction'
             )
+            new_construction_outside_cumulative = self.__get_cumulative_change(
+                outside_rpa_change_maps, 'new_construction'
+            )
+
+            # 集計後は区域内外のレイヤも不要
+            del inside_rpa_change_maps, outside_rpa_change_maps
 
             # 新築指数（区域内外）- 変化度マップは新築のみ
             new_construction_index_inside_rpa = self.__calculate_construction_index(
-                inside_rpa_change_maps, residential_land_mesh_count, 'new_construction'
+                new_construction_inside_cumulative, residential_land_mesh_count
             )
             new_construction_index_outside_rpa = self.__calculate_construction_index(
-                outside_rpa_change_maps, residential_land_mesh_count, 'new_construction'
+                new_construction_outside_cumulative, residential_land_mesh_count
             )
 
             # 滅失指数とその他指数
@@ -192,7 +221,7 @@ class LandUseMetricCalculator:
             other_construction_index_outside_rpa = ''
             # 積算変化度と変化量の差を計算
             new_construction_cumulative_change = self.__calculate_cumulative_change_index(
-                inside_rpa_change_maps, outside_rpa_change_maps, 'new_construction'
+                new_construction_inside_cumulative, new_construction_outside_cumulative
             )
             # 滅失とその他
             demolition_cumulative_change = ''
@@ -254,7 +283,7 @@ class LandUseMetricCalculator:
             # エラーメッセージのログ出力
             QgsMessageLog.logMessage(
                 self.tr("An error occurred: %1").replace("%1", str(e)),
-                self.tr("Plugin"),
+                self._plugin_tag,
                 Qgis.Critical,
             )
             raise e
@@ -280,38 +309,49 @@ class LandUseMetricCalculator:
                 'other_construction_index_cumulative_change_index': '',
                 'other_construction_index_building_index_delta_gap_rpa_vs_outside': '',
             }]
-        self.export(
-            self.base_path + f'\\IF105_土地利用関連評価指標ファイル{self.file_suffix}.csv',
-            data_list,
-        )
+        self.export(self.output_path, data_list)
 
     def export(self, file_path, data):
-        """エクスポート処理"""
+        """エクスポート処理
+
+        Args:
+            file_path: 出力先のパス
+            data: 行データ（辞書）のリストまたはイテレータ
+        """
         try:
-            if not data:
+            rows = iter(data)
+            first_row = next(rows, None)
+            if first_row is None:
                 raise Exception(self.tr("The data to export is empty."))
 
             # データ項目からヘッダーを取得
-            headers = list(data[0].keys())
+            headers = list(first_row.keys())
 
             # CSVファイル書き込み
             with open(
-                file_path, mode='w', newline='', encoding='utf-8'
+                file_path, mode='w', newline='', encoding='utf-8', buffering=1 << 20
             ) as csv_file:
-                writer = csv.DictWriter(csv_file, fieldnames=headers)
-                writer.writeheader()
+                writer = csv.writer(csv_file)
+                writer.writerow(headers)
 
-                for row in data:
+                # 一定行数ごとにまとめて書き込み
+                batch = []
+                for row in itertools.chain([first_row], rows):
                     # 全値が空文字の行（ヘッダー定義用）はスキップ
                     if any(v != '' for v in row.values()):
-                        writer.writerow(row)
+                        batch.append([row.get(header, '') for header in headers])
+                    if len(batch) >= self.EXPORT_BATCH_SIZE:
+                        writer.writerows(batch)
+                        batch.clear()
+                if batch:
+                    writer.writerows(batch)
 
             msg = self.tr(
                 "File export completed: %1."
             ).replace("%1", file_path)
             QgsMessageLog.logMessage(
                 msg,
-                self.tr("Plugin"),
+                self._plugin_tag,
                 Qgis.Info,
             )
             return True
@@ -322,7 +362,7 @@ class LandUseMetricCalculator:
             ).replace("%1", str(e))
             QgsMessageLog.logMessage(
                 msg,
-                self.tr("Plugin"),
+                self._plugin_tag,
                 Qgis.Critical,
             )
             raise e
@@ -334,14 +374,106 @@ class LandUseMetricCalculator:
         else:
             return round(value, decimal_places)
 
+    def __run_parallel(self, tasks):
+        """互いに独立した処理をスレッドで並列に実行
+
+        タスク内で作成したレイヤは実行したスレッドに属するため、
+        呼び出し元のスレッドへ移動してから返す。
+        呼び出し元のスレッドに属するレイヤはタスク内で使用しないこと。
+
+        Args:
+            tasks: 引数なしで呼び出す関数のリスト
+
+        Returns:
+            各関数の戻り値のリスト（tasksと同じ順序）
+        """
+        caller_thread = QThread.currentThread()
+
+        def run(task):
+            result = task()
+            if isinstance(result, QgsVectorLayer) and result.thread() != caller_thread:
+                result.moveToThread(caller_thread)
+            return result
+
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(run, task) for task in tasks]
+            return [future.result() for future in futures]
+
+    def __load_layers(self, layer_names):
+        """GeoPackageから複数のレイヤを並列に読み込み（読み込めないレイヤはNone）"""
+        # 一括読み込みの間はレイヤごとのInfoログを出力しない
+        verbose = self.gpkg_manager.verbose
+        self.gpkg_manager.verbose = False
+        try:
+            return self.__run_parallel([
+                functools.partial(
+                    self.gpkg_manager.load_layer, layer_name, None, withload_project=False
+                )
+                for layer_name in layer_names
+            ])
+        finally:
+            self.gpkg_manager.verbose = verbose
+
+    def __filter_by_subset(self, layer, expression):
+        """レイヤを条件に合うフィーチャに絞り込み（該当なしの場合はNone）
+
+        読み込んだレイヤはこの算出処理専用のため、コピーを作らずに
+        プロバイダのフィルタ（GeoPackageではSQLのWHERE句）で絞り込む。
+        プロバイダがフィルタに対応しない場合は抽出したレイヤを返す。
+        """
+        if not layer:
+            return None
+
+        if not layer.setSubsetString(expression):
+            layer = processing.run(
+                "native:extractbyexpression",
+                {
+                    'INPUT': layer,
+                    'EXPRESSION': expression,
+                    'OUTPUT': 'TEMPORARY_OUTPUT'
+                }
+            )['OUTPUT']
+
+        if layer.featureCount() == 0:
+            return None
+        return layer
+
+    def __covers_extent(self, zones_layer, target_layer):
+        """いずれかの区域が対象レイヤの範囲全体を含むかを判定
+
+        含む場合は対象レイヤの全フィーチャがその区域内にあるため、空間検索を省略できる。
+        ただし、空間検索で除外されるジオメトリなし（空を含む）のフィーチャがある場合は省略できない。
+        """
+        if zones_layer.crs() != target_layer.crs():
+            return False
+
+        target_extent = target_layer.extent()
+        if target_extent.isNull() or not zones_layer.extent().contains(target_extent):
+            return False
+
+        extent_geometry = QgsGeometry.fromRect(target_extent)
+        covered = any(
+            feature.hasGeometry() and feature.geometry().contains(extent_geometry)
+            for feature in zones_layer.getFeatures(QgsFeatureRequest().setNoAttributes())
+        )
+        if not covered:
+            return False
+
+        return not any(
+            not feature.hasGeometry() or feature.geometry().isEmpty()
+            for feature in target_layer.getFeatures(QgsFeatureRequest().setNoAttributes())
+        )
+
     def __extract_within_zones(self, target_layer, zones_layer):
         """行政区域内のフィーチャを抽出"""
+        # 行政区域が対象レイヤ全体を含む場合は抽出不要
+        if self.__covers_extent(zones_layer, target_layer):
+            return target_layer
+
+        # 行政区域の空間インデックスは呼び出し元で作成済み
         processing.run(
             "native:createspatialindex", {'INPUT': target_layer}
         )
-        processing.run(
-            "native:createspatialindex", {'INPUT': zones_layer}
-        )
         result = processing.run(
             "native:extractbylocation",
             {
@@ -353,36 +485,71 @@ class LandUseMetricCalculator:
         )['OUTPUT']
         return result
 
-    def __exclude_industrial_zones(self, change_maps_layer, land_use_areas_layer):
-        """工業専用地域を除外"""
+    def __get_industrial_zones(self, land_use_areas_layer):
+        """工業専用地域を抽出して1つのジオメトリに統合したレイヤを取得（該当なしの場合はNone）"""
         # 工業専用地域フィルタ
-        industrial_zones = processing.run(
-            "native:extractbyexpression",
+        industrial_zones = self.__filter_by_subset(
+            land_use_areas_layer, '"land_use_type" = \'工業専用地域\''
+        )
+        if industrial_zones is None:
+            return None
+
+        # いずれの工業専用地域とも重ならないことは、統合した地域と重ならないことと同じため統合しておく
+        return processing.run(
+            "native:dissolve",
             {
-                'INPUT': land_use_areas_layer,
-                'EXPRESSION': '"land_use_type" = \'工業専用地域\'',
+                'INPUT': industrial_zones,
+                'FIELD': [],
                 'OUTPUT': 'TEMPORARY_OUTPUT',
             },
         )['OUTPUT']
 
-        # 空間インデックス作成
-        processing.run(
-            "native:createspatialindex", {'INPUT': change_maps_layer}
-        )
-        processing.run(
-            "native:createspatialindex", {'INPUT': industrial_zones}
-        )
+    def __exclude_industrial_zones(self, change_maps_layer, land_use_areas_layer):
+        """工業専用地域を除外"""
+        industrial_zones = self.__get_industrial_zones(land_use_areas_layer)
+        if industrial_zones is None:
+            return change_maps_layer
+
+        # 統合した工業専用地域のジオメトリを変化度マップの座標系で取得
+        request = QgsFeatureRequest().setNoAttributes()
+        request.setDestinationCrs(change_maps_layer.crs(), QgsProject.instance().transformContext())
+        industrial_geometries = [
+            feature.geometry()
+            for feature in industrial_zones.getFeatures(request)
+            if feature.hasGeometry()
+        ]
+        if not industrial_geometries:
+            return change_maps_layer
 
         # 工業専用地域と重ならないchange_mapsを抽出
-        result = processing.run(
-            "native:extractbylocation",
-            {
-                'INPUT': change_maps_layer,
-                'PREDICATE': [2],  # disjoint
-                'INTERSECT': industrial_zones,
-                'OUTPUT': 'TEMPORARY_OUTPUT',
-            },
-        )['OUTPUT']
+        return self.__filter_disjoint(change_maps_layer, industrial_geometries[0])
+
+    def __filter_disjoint(self, target_layer, geometry):
+        """ジオメトリと重ならないフィーチャを抽出
+
+        ジオメトリは準備済み（PreparedGeometry）にして判定し、
+        範囲が重ならないフィーチャは判定自体を省略する。
+        """
+        engine = QgsGeometry.createGeometryEngine(geometry.constGet())
+        engine.prepareGeometry()
+        bounding_box = geometry.boundingBox()
+
+        features = []
+        for feature in target_layer.getFeatures():
+            if not feature.hasGeometry():
+                continue
+            feature_geometry = feature.geometry()
+            if (not feature_geometry.boundingBox().intersects(bounding_box) or
+                    not engine.intersects(feature_geometry.constGet())):
+                features.append(feature)
+
+        result = QgsMemoryProviderUtils.createMemoryLayer(
+            target_layer.name(),
+            target_layer.fields(),
+            target_layer.wkbType(),
+            target_layer.crs(),
+        )
+        result.dataProvider().addFeatures(features)
         return result
 
     def __get_residential_land_mesh_count(self, land_use_meshes_layer, urban_plannings_layer, target_zones_layer):
@@ -391,70 +558,141 @@ class LandUseMetricCalculator:
             if not land_use_meshes_layer:
                 return 0
 
-            # 都市計画区域がある場合はその範囲内、ない場合は全てのメッシュを対象とする
-            if urban_plannings_layer:
-                # 空間インデックス作成
-                processing.run(
-                    "native:createspatialindex",
-                    {'INPUT': land_use_meshes_layer}
-                )
-                processing.run(
-                    "native:createspatialindex",
-                    {'INPUT': urban_plannings_layer}
-                )
-                # 都市計画区域内のメッシュを抽出
-                urban_meshes = processing.run(
-                    "native:extractbylocation",
-                    {
-                        'INPUT': land_use_meshes_layer,
-                        'PREDICATE': [6],  # within
-                        'INTERSECT': urban_plannings_layer,
-                        'OUTPUT': 'TEMPORARY_OUTPUT',
-                    },
-                )['OUTPUT']
-            else:
-                urban_meshes = land_use_meshes_layer
-
-            # 空間インデックス作成
-            processing.run(
-                "native:createspatialindex", {'INPUT': urban_meshes}
-            )
-
-            # 行政区域制約を適用
-            admin_constrained_meshes = processing.run(
-                "native:extractbylocation",
-                {
-                    'INPUT': urban_meshes,
-                    'PREDICATE': [6],  # within
-                    'INTERSECT': target_zones_layer,
-                    'OUTPUT': 'TEMPORARY_OUTPUT',
-                },
-            )['OUTPUT']
-
-            # 建物用地のメッシュを抽出（type=0700）
+            # 建物用地のメッシュを先に抽出（type=0700）し、空間検索の対象を絞り込む
             residential_meshes = processing.run(
                 "native:extractbyexpression",
                 {
-                    'INPUT': admin_constrained_meshes,
+                    'INPUT': land_use_meshes_layer,
                     'EXPRESSION': '"type" = \'0700\'',
                     'OUTPUT': 'TEMPORARY_OUTPUT',
                 },
             )['OUTPUT']
 
+            # 都市計画区域がある場合はその範囲内、ない場合は全てのメッシュを対象とする
+            if urban_plannings_layer:
+                residential_meshes = self.__extract_within_constraint(
+                    residential_meshes, urban_plannings_layer
+                )
+
+            # 行政区域制約を適用（行政区域の空間インデックスは呼び出し元で作成済み）
+            residential_meshes = self.__extract_within_constraint(
+                residential_meshes, target_zones_layer, create_index=False
+            )
+
             return residential_meshes.featureCount()
         except Exception:
             return 0
 
+    def __extract_within_constraint(self, meshes_layer, constraint_layer, create_index=True):
+        """範囲内（within）のメッシュを抽出（範囲が対象メッシュ全体を含む場合は抽出不要）"""
+        if self.__covers_extent(constraint_layer, meshes_layer):
+            return meshes_layer
+
+        # 空間インデックス作成
+        processing.run(
+            "native:createspatialindex", {'INPUT': meshes_layer}
+        )
+        if create_index:
+            processing.run(
+                "native:createspatialindex", {'INPUT': constraint_layer}
+            )
+
+        return processing.run(
+            "native:extractbylocation",
+            {
+                'INPUT': meshes_layer,
+                'PREDICATE': [6],  # within
+                'INTERSECT': constraint_layer,
+                'OUTPUT': 'TEMPORARY_OUTPUT',
+            },
+        )['OUTPUT']
+
+    def __build_induction_index(self, residential_area_layer, crs):
+        """居住誘導区域の空間インデックスと準備済みジオメトリを作成
+
+        フィーチャ数が少ない場合はprocessingの空間検索の方が速いためNoneを返す。
+
+        Returns:
+            (空間インデックス, {フィーチャID: (ジオメトリ, ジオメトリエンジン)})、またはNone
+        """
+        if (not residential_area_layer or
+                residential_area_layer.featureCount() < self.INDUCTION_INDEX_MIN_FEATURES):
+            return None
+
+        # 変化度マップの座標系に揃えて読み込み
+        request = QgsFeatureRequest().setNoAttributes()
+        request.setDestinationCrs(crs, QgsProject.instance().transformContext())
+
+        spatial_index = QgsSpatialIndex()
+        engines = {}
+        for feature in residential_area_layer.getFeatures(request):
+            if not feature.hasGeometry():
+                continue
+            geometry = feature.geometry()
+            engine = QgsGeometry.createGeometryEngine(geometry.constGet())
+            engine.prepareGeometry()
+            # エンジンが参照するジオメトリも合わせて保持
+            engines[feature.id()] = (geometry, engine)
+            spatial_index.addFeature(feature)
+
+        return spatial_index, engines
+
+    def __partition_by_induction_index(self, change_maps_layer, induction_index):
+        """空間インデックスと準備済みジオメトリで変化度データを区域内外に振り分け
+
+        1回の走査で、いずれかの区域内（within）のフィーチャと
+        全区域と重ならない（disjoint）フィーチャをそれぞれのレイヤに追加する。
+
+        Returns:
+            (居住誘導区域内のレイヤ, 居住誘導区域外のレイヤ)
+        """
+        spatial_index, engines = induction_index
+
+        inside_layer, outside_layer = (
+            QgsMemoryProviderUtils.createMemoryLayer(
+                change_maps_layer.name(),
+                change_maps_layer.fields(),
+                change_maps_layer.wkbType(),
+                change_maps_layer.crs(),
+            )
+            for _ in range(2)
+        )
+        inside_features = []
+        outside_features = []
+
+        for feature in change_maps_layer.getFeatures():
+            if not feature.hasGeometry():
+                continue
+            geometry = feature.geometry()
+            abstract_geometry = geometry.constGet()
+
+            # 重なる区域がなければ区域外、重なる区域のいずれかに含まれれば区域内
+            intersecting = [
+                fid for fid in spatial_index.intersects(geometry.boundingBox())
+                if engines[fid][1].intersects(abstract_geometry)
+            ]
+            if not intersecting:
+                outside_features.append(feature)
+            elif any(engines[fid][1].contains(abstract_geometry) for fid in intersecting):
+                inside_features.append(feature)
+
+            # 一定件数ごとにまとめて追加
+            if len(inside_features) >= self.PARTITION_BATCH_SIZE:
+                inside_layer.dataProvider().addFeatures(inside_features)
+                inside_features = []
+            if len(outside_features) >= self.PARTITION_BATCH_SIZE:
+                outside_layer.dataProvider().addFeatures(outside_features)
+                outside_features = []
+
+        inside_layer.dataProvider().addFeatures(inside_features)
+        outside_layer.dataProvider().addFeatures(outside_features)
+        return inside_layer, outside_layer
+
     def __extract_within_induction_areas(self, change_maps_layer, residential_area_layer):
-        """居住誘導区域内の変化度データを抽出"""
+        """居住誘導区域内の変化度データを抽出（区域がない場合はNone）"""
         if not residential_area_layer or residential_area_layer.featureCount() == 0:
-            # 空のレイヤを返す
-            empty_layer = QgsVectorLayer(
-                "Polygon?crs=" + change_maps_layer.crs().authid(),
-                "empty_induction",
-                "memory",
-            )
-            return empty_layer
+            # 区域がない場合は該当データなし
+            return None
 
         result = processing.run(
             "native:extractbylocation",
@@ -483,57 +721,31 @@ class LandUseMetricCalculator:
         )['OUTPUT']
         return result
 
-    def __calculate_construction_index(self, change_maps_layer, residential_land_mesh_count, index_type):
-        """建築指数を計算"""
+    def __calculate_construction_index(self, cumulative_change, residential_land_mesh_count):
+        """建築指数を計算
+
+        Args:
+            cumulative_change: 積算変化度（(変化度1のメッシュ数×1) + (変化度2のメッシュ数×2) + ...）
+            residential_land_mesh_count: 都市計画区域内の宅地利用メッシュ数
+        """
         try:
             if residential_land_mesh_count == 0:
                 return ''
 
-            # 変化度別にメッシュ数をカウント
-            change_degree_counts = {1: 0, 2: 0, 3: 0, 4: 0}
-
-            # index_typeに応じたフィールド名を決定
-            if index_type == 'new_construction':
-                field_name = 'level'
-            elif index_type == 'demolition':
-                field_name = 'demolition_degree'  # 滅失は滅失度フィールド
-            else:  # other_construction
-                field_name = 'other_degree'  # その他はその他度フィールド
-
-            for feature in change_maps_layer.getFeatures():
-                try:
-                    degree_value = feature[field_name]
-                    try:
-                        degree_int = int(degree_value) if degree_value is not None else None
-                        if degree_int in change_degree_counts:
-                            change_degree_counts[degree_int] += 1
-                    except (ValueError, TypeError):
-                        continue
-                except (KeyError, AttributeError):
-                    # フィールドが存在しない場合はスキップ
-                    continue
-
-            # 積算変化度を計算: (変化度1のメッシュ数×1) + (変化度2のメッシュ数×2) + ...
-            cumulative_change = sum(
-                degree * count for degree, count in change_degree_counts.items()
-            )
-
             # 指数 = 積算変化度 / 都市計画区域内の宅地利用メッシュ数
             index = cumulative_change / residential_land_mesh_count if residential_land_mesh_count > 0 else 0
             return self.round_or_na(index, 2)
         except Exception:
             return ''
 
-    def __calculate_cumulative_change_index(self, inside_maps, outside_maps, index_type):
+    def __calculate_cumulative_change_index(self, inside_cumulative, outside_cumulative):
         """積算変化度を計算"""
         # 区域内外の積算変化度を合計
-        inside_cumulative = self.__get_cumulative_change(inside_maps, index_type)
-        outside_cumulative = self.__get_cumulative_change(outside_maps, index_type)
         total_cumulative = inside_cumulative + outside_cumulative
         return self.round_or_na(total_cumulative, 2)
 
     def __get_cumulative_change(self, change_maps_layer, index_type):
-        """変化度レイヤから積算変化度を計算"""
+        """変化度レイヤから積算変化度を計算（レイヤがNoneの場合は0）"""
         if index_type == 'new_construction':
             field_name = 'level'
         elif index_type == 'demolition':
@@ -541,21 +753,29 @@ class LandUseMetricCalculator:
         else:  # other_construction
             field_name = 'other_degree'
 
-        change_degree_counts = {1: 0, 2: 0, 3: 0, 4: 0}
+        # データがない場合は集計を行わない
+        if change_maps_layer is None or change_maps_layer.featureCount() == 0:
+            return 0
 
-        try:
-            for feature in change_maps_layer.getFeatures():
-                degree_value = feature[field_name]
-                try:
-                    degree_int = int(degree_value) if degree_value is not None else None
-                    if degree_int in change_degree_counts:
-                        change_degree_counts[degree_int] += 1
-                except (ValueError, TypeError):
-                    continue
-        except (KeyError, AttributeError):
-            # フィールドが存在しない場合は0を返す
+        # フィールドが存在しない場合は0を返す
+        field_index = change_maps_layer.fields().indexFromName(field_name)
+        if field_index < 0:
             return 0
 
+        change_degree_counts = {1: 0, 2: 0, 3: 0, 4: 0}
+
+        # ジオメトリは読み込まず、変化度のフィールドのみ取得
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([field_index])
+        for feature in change_maps_layer.getFeatures(request):
+            degree_value = feature[field_index]
+            try:
+                degree_int = int(degree_value) if degree_value is not None else None
+                if degree_int in change_degree_counts:
+                    change_degree_counts[degree_int] += 1
+            except (ValueError, TypeError):
+                continue
+
         # 積算変化度を計算
         cumulative_change = sum(
             degree * count for degree, count in change_degree_counts.items()
@@ -8,12 +8,15 @@
 
 import re
 import csv
+import itertools
+import numpy as np
 from qgis.core import (
     QgsMessageLog,
     Qgis,
-    QgsVectorLayer,
-    QgsFeature,
-    QgsAggregateCalculator,
+    QgsFeatureRequest,
+    QgsGeometry,
+    QgsPoint,
+    QgsProject,
 )
 from PyQt5.QtCore import QCoreApplication
 import processing
@@ -70,87 +73,27 @@ class PublicTransportMetricCalculator:
                 raise Exception(self.tr("The %1 layer was not found.")
                     .replace("%1", "bus_stop_buffers"))
 
-            # is_target=1のzonesを取得してフィルタリング用のレイヤを作成
-            target_zones_layer = None
-            if zones_layer:
-                target_zones_layer = QgsVectorLayer(
-                    "Polygon?crs=" + zones_layer.crs().authid(),
-                    "target_zones",
-                    "memory",
-                )
-                target_zones_data = target_zones_layer.dataProvider()
-                target_zones_data.addAttributes(zones_layer.fields())
-                target_zones_layer.updateFields()
-
-                target_zones_features = []
-                for zone_feature in zones_layer.getFeatures():
-                    if zone_feature["is_target"] == 1:
-                        target_zones_features.append(zone_feature)
-
-                if target_zones_features:
-                    target_zones_data.addFeatures(target_zones_features)
-                    target_zones_layer.updateExtents()
-                else:
-                    target_zones_layer = None
+            # is_target=1のzonesに絞り込み
+            # 読み込んだレイヤはこの算出処理専用のため、コピーせずにプロバイダのフィルタで絞り込む
+            # （フィルタに対応しないプロバイダの場合は抽出したレイヤを使用）
+            if not zones_layer.setSubsetString('"is_target" = 1'):
+                zones_layer = processing.run(
+                    "native:extractbyexpression",
+                    {
+                        'INPUT': zones_layer,
+                        'EXPRESSION': '"is_target" = 1',
+                        'OUTPUT': 'memory:'
+                    }
+                )['OUTPUT']
+            target_zones_layer = zones_layer if zones_layer.featureCount() > 0 else None
 
             # target_zones_layerがない場合は集計を行わない
             if not target_zones_layer:
                 self.__export_data([])
                 return
 
-            # 建物の重心を計算
-            centroids_result = processing.run(
-                "native:centroids",
-                {
-                    'INPUT': buildings_layer,
-                    'ALL_PARTS': False,
-                    'OUTPUT': 'memory:'
-                }
-            )
-            centroids_all = centroids_result['OUTPUT']
-
-            # 空間インデックス作成
-            processing.run(
-                "native:createspatialindex", {'INPUT': centroids_all}
-            )
-            processing.run(
-                "native:createspatialindex", {'INPUT': target_zones_layer}
-            )
-
-            # target_zones内の重心のみを抽出
-            if target_zones_layer and target_zones_layer.featureCount() > 0:
-                joined_result = processing.run(
-                    "native:joinattributesbylocation",
-                    {
-                        'INPUT': centroids_all,
-                        'JOIN': target_zones_layer,
-                        'PREDICATE': [5],  # within
-                        'JOIN_FIELDS': [],  # フィールド結合は不要
-                        'METHOD': 0,
-                        'DISCARD_NONMATCHING': True,  # マッチしないものは除外
-                        'PREFIX': '',
-                        'OUTPUT': 'memory:'
-                    }
-                )
-                centroid_layer = joined_result['OUTPUT']
-            else:
-                # target_zonesがない場合は全重心を使用
-                centroid_layer = centroids_all
-
-            # 空間インデックス作成
-            processing.run(
-                "native:createspatialindex", {'INPUT': centroid_layer}
-            )
-
-            centroid_layer = self.gpkg_manager.add_layer(
-                centroid_layer, "tmp_building_centroids", None, False
-            )
-            if not centroid_layer:
-                raise Exception(self.tr("Failed to add layer to GeoPackage."))
-
             # 属性名を取得
             fields = buildings_layer.fields()
-            buildings_layer = None
 
             # 年度情報を取得
             years = set()
@@ -164,168 +107,87 @@ class PublicTransportMetricCalculator:
             # 年度をリスト化してソート
             unique_years = sorted(list(years))
 
-            # データリストを作成
-            data_list = []
-
-            # 市内、鉄道カバー圏の建物を取得
-            railway_buildings = self.__extract(
-                centroid_layer, railway_station_buffers_layer
-            )
-
-            # 市内、バスカバー圏の建物を取得
-            bus_buildings = self.__extract(
-                centroid_layer, bus_stop_buffers_layer
-            )
-
-
-
-
-            for year in unique_years:
-                if self.check_canceled():
-                    return  # キャンセルチェック
-                year_field = f"{year}_population"
-
-                # 行政区域制約付きの総人口を集計
-                total_pop = self.__aggregate_sum(centroid_layer, year_field)
-
-                # 鉄道カバー圏人口
-                rail_pop_covered = self.__aggregate_sum(railway_buildings, year_field)
+            # 年度ごとの人口フィールドのインデックスを事前に取得（存在しない場合は-1）
+            population_field_indices = [
+                fields.indexOf(f"{year}_population") for year in unique_years
+            ]
 
-                # バスカバー圏人口
-                bus_pop_covered = self.__aggregate_sum(bus_buildings, year_field)
-
-                # 公共交通カバー圏人口（鉄道またはバス）- ユニオン処理
-                # 鉄道とバスカバー圏をユニオンして重複を除去
-                railway_count = railway_buildings.featureCount()
-                bus_count = bus_buildings.featureCount()
-
-                if railway_count > 0 and bus_count > 0:
-                    # 両方にフィーチャがある場合はユニオン
-                    union_result = processing.run(
-                        "native:union",
-                        {
-                            'INPUT': railway_buildings,
-                            'OVERLAY': bus_buildings,
-                            'OVERLAY_FIELDS_PREFIX': '',
-                            'OUTPUT': 'memory:'
-                        }
-                    )
-                    union_layer = union_result['OUTPUT']
-                elif railway_count > 0:
-                    # 鉄道のみ
-                    union_layer = railway_buildings
-                elif bus_count > 0:
-                    # バスのみ
-                    union_layer = bus_buildings
-                else:
-                    # 両方とも空
-                    union_layer = railway_buildings
-
-                # ユニオン結果から人口を集計
-                transit_pop_covered = self.__aggregate_sum(union_layer, year_field)
+            # 建物の重心の座標と人口を一度だけ読み込み、行政区域・鉄道・バスの判定と集計で共有
+            # （重心のレイヤは作成せず、読み込みながら重心を計算）
+            crs = buildings_layer.crs()
+            building_points = self.__read_points(buildings_layer, population_field_indices)
+            buildings_layer = None
 
+            # target_zones内の重心のみを対象とする（区域を統合すると境界上の重心も含まれるため、区域ごとに判定）
+            zone_mask = self.__extract(
+                building_points, self.__read_geometries(target_zones_layer, crs)
+            ).astype(bool)
+            centroid_points = tuple(array[zone_mask] for array in building_points)
+            # 使用済みのデータを解放
+            del building_points, zone_mask
+            zones_layer = None
+            target_zones_layer = None
 
-                # 鉄道カバー率
-                rail_pop_coverage = (
-                    self.round_or_na(rail_pop_covered / total_pop, 3)
-                    if total_pop > 0
-                    else '―'
-                )
+            # カバー圏域のジオメトリを重心の座標系で取得
+            railway_geometries = self.__read_geometries(
+                railway_station_buffers_layer, crs
+            )
+            bus_geometries = self.__read_geometries(
+                bus_stop_buffers_layer, crs
+            )
 
-                # バスカバー率
-                bus_pop_coverage = (
-                    self.round_or_na(bus_pop_covered / total_pop, 3)
-                    if total_pop > 0
-                    else '―'
-                )
+            # 市内、鉄道カバー圏・バスカバー圏の建物を取得
+            railway_mask = self.__extract(centroid_points, railway_geometries)
+            bus_mask = self.__extract(centroid_points, bus_geometries)
+            # 使用済みのデータを解放
+            del railway_geometries, bus_geometries
+            railway_station_buffers_layer = None
+            bus_stop_buffers_layer = None
+
+            # 公共交通カバー圏（鉄道またはバス）の建物は両者の和（年度によらず同じ）
+            transit_mask = railway_mask | bus_mask
+
+            # 全年度の人口をまとめて集計
+            # ・行政区域制約付きの総人口
+            # ・鉄道カバー圏人口
+            # ・バスカバー圏人口
+            # ・公共交通カバー圏人口（鉄道またはバス、重複は1回のみ集計）
+            (
+                total_pops,
+                rail_pops_covered,
+                bus_pops_covered,
+                transit_pops_covered,
+            ) = self.__sum_by_masks(
+                centroid_points[2],
+                [None, railway_mask, bus_mask, transit_mask],
+            )
+            # 重心の配列とマスクは以降使用しないため解放
+            del centroid_points, railway_mask, bus_mask, transit_mask
+
+            # カバー率と前年度からの増減を全年度まとめて計算
+            # ・鉄道カバー率
+            # ・バスカバー率
+            # ・交通共通カバー率（公共交通カバー率）
+            rail_pop_coverages, rail_pop_coverage_deltas = self.__coverage_series(
+                rail_pops_covered, total_pops
+            )
+            bus_pop_coverages, bus_pop_coverage_deltas = self.__coverage_series(
+                bus_pops_covered, total_pops
+            )
+            transit_pop_coverages, transit_pop_coverage_deltas = self.__coverage_series(
+                transit_pops_covered, total_pops
+            )
 
-                # 交通共通カバー率（公共交通カバー率）
-                transit_pop_coverage = (
-                    self.round_or_na(transit_pop_covered / total_pop, 3)
-                    if total_pop > 0
-                    else '―'
-                )
+            if self.check_canceled():
+                return  # キャンセルチェック
 
-                # 前年度のデータがあれば、変化率を計算
-                if data_list:
-                    previous_year_data = data_list[-1]
-
-
-                    rail_pop_coverage_delta = (
-                        self.round_or_na(rail_pop_coverage - previous_year_data['rail_pop_coverage'], 2)
-                        if isinstance(previous_year_data['rail_pop_coverage'], (int, float))
-                        and isinstance(rail_pop_coverage, (int, float))
-                        else '―'
-                    )
-
-                    bus_pop_coverage_delta = (
-                        self.round_or_na(bus_pop_coverage - previous_year_data['bus_pop_coverage'], 2)
-                        if isinstance(previous_year_data['bus_pop_coverage'], (int, float))
-                        and isinstance(bus_pop_coverage, (int, float))
-                        else '―'
-                    )
-
-                    transit_pop_coverage_delta = (
-                        self.round_or_na(transit_pop_coverage - previous_year_data['transit_pop_coverage'], 2)
-                        if isinstance(previous_year_data['transit_pop_coverage'], (int, float))
-                        and isinstance(transit_pop_coverage, (int, float))
-                        else '―'
-                    )
-
-                else:
-                    rail_pop_coverage_delta = '―'
-                    bus_pop_coverage_delta = '―'
-                    transit_pop_coverage_delta = '―'
-
-                # データを辞書にまとめる
-                year_data = {
-                    # 年次
-                    'year': year,
-                    # 公共交通徒歩圏人口カバー率
-                    'transit_walk_pop_coverage': '',
-                    # 徒歩圏人口カバー率の増減
-                    'transit_walk_pop_coverage_delta': '',
-                    # 全国平均値
-                    'transit_walk_pop_coverage_national_avg': '',
-                    # 都道府県平均値
-                    'transit_walk_pop_coverage_pref_avg': '',
-                    # 鉄道カバー人口
-                    'rail_pop_covered': rail_pop_covered,
-                    # 鉄道カバー率
-                    'rail_pop_coverage': rail_pop_coverage,
-                    # 鉄道カバー率増減
-                    'rail_pop_coverage_delta': rail_pop_coverage_delta if data_list else '―',
-                    # 全国平均値
-                    'rail_pop_coverage_national_avg': '',
-                    # 都道府県平均値
-                    'rail_pop_coverage_pref_avg': '',
-                    # バスカバー人口
-                    'bus_pop_covered': bus_pop_covered,
-                    # バスカバー率
-                    'bus_pop_coverage': bus_pop_coverage,
-                    # バスカバー率増減
-                    'bus_pop_coverage_delta': bus_pop_coverage_delta if data_list else '―',
-                    # 全国平均値
-                    'bus_pop_coverage_national_avg': '',
-                    # 都道府県平均値
-                    'bus_pop_coverage_pref_avg': '',
-                    # 交通共通カバー人口
-                    'transit_pop_covered': transit_pop_covered,
-                    # 交通共通カバー率
-                    'transit_pop_coverage': transit_pop_coverage,
-                    # 交通共通カバー率増減
-                    'transit_pop_coverage_delta': transit_pop_coverage_delta if data_list else '―',
-                    # 全国平均値
-                    'transit_pop_coverage_national_avg': '',
-                    # 都道府県平均値
-                    'transit_pop_coverage_pref_avg': '',
-                }
-
-                # 辞書をリストに追加
-                data_list.append(year_data)
-
-            # エクスポート（空の場合はヘッダーだけのCSVを出力）
-            self.__export_data(data_list)
+            # 年度ごとの行を生成しながらエクスポート（空の場合はヘッダーだけのCSVを出力）
+            self.__export_data(self.__iter_year_data(
+                unique_years,
+                (rail_pops_covered, rail_pop_coverages, rail_pop_coverage_deltas),
+                (bus_pops_covered, bus_pop_coverages, bus_pop_coverage_deltas),
+                (transit_pops_covered, transit_pop_coverages, transit_pop_coverage_deltas),
+            ))
 
             return
 
@@ -338,9 +200,77 @@ class PublicTransportMetricCalculator:
             )
             raise e
 
+    def __iter_year_data(self, years, rail_series, bus_series, transit_series):
+        """
+        年度ごとの出力データを生成
+        :param years: 年度のリスト
+        :param rail_series: 鉄道の (カバー人口, カバー率, カバー率増減) のリスト
+        :param bus_series: バスの (カバー人口, カバー率, カバー率増減) のリスト
+        :param transit_series: 交通共通の (カバー人口, カバー率, カバー率増減) のリスト
+        :return: 年度ごとのデータ（辞書）のイテレータ
+        """
+        for (
+            year,
+            (rail_pop_covered, rail_pop_coverage, rail_pop_coverage_delta),
+            (bus_pop_covered, bus_pop_coverage, bus_pop_coverage_delta),
+            (transit_pop_covered, transit_pop_coverage, transit_pop_coverage_delta),
+        ) in zip(years, zip(*rail_series), zip(*bus_series), zip(*transit_series)):
+            # データを辞書にまとめる
+            year_data = {
+                # 年次
+                'year': year,
+                # 公共交通徒歩圏人口カバー率
+                'transit_walk_pop_coverage': '',
+                # 徒歩圏人口カバー率の増減
+                'transit_walk_pop_coverage_delta': '',
+                # 全国平均値
+                'transit_walk_pop_coverage_national_avg': '',
+                # 都道府県平均値
+                'transit_walk_pop_coverage_pref_avg': '',
+                # 鉄道カバー人口
+                'rail_pop_covered': rail_pop_covered,
+                # 鉄道カバー率
+                'rail_pop_coverage': rail_pop_coverage,
+                # 鉄道カバー率増減
+                'rail_pop_coverage_delta': rail_pop_coverage_delta,
+                # 全国平均値
+                'rail_pop_coverage_national_avg': '',
+                # 都道府県平均値
+                'rail_pop_coverage_pref_avg': '',
+                # バスカバー人口
+                'bus_pop_covered': bus_pop_covered,
+                # バスカバー率
+                'bus_pop_coverage': bus_pop_coverage,
+                # バスカバー率増減
+                'bus_pop_coverage_delta': bus_pop_coverage_delta,
+                # 全国平均値
+                'bus_pop_coverage_national_avg': '',
+                # 都道府県平均値
+                'bus_pop_coverage_pref_avg': '',
+                # 交通共通カバー人口
+                'transit_pop_covered': transit_pop_covered,
+                # 交通共通カバー率
+                'transit_pop_coverage': transit_pop_coverage,
+                # 交通共通カバー率増減
+                'transit_pop_coverage_delta': transit_pop_coverage_delta,
+                # 全国平均値
+                'transit_pop_coverage_national_avg': '',
+                # 都道府県平均値
+                'transit_pop_coverage_pref_avg': '',
+            }
+
+            yield year_data
+
     def __export_data(self, data_list):
-        """データをCSVにエクスポート（空の場合はヘッダーだけのCSVを出力）"""
-        if not data_list:
+        """データをCSVにエクスポート（空の場合はヘッダーだけのCSVを出力）
+
+        data_listはリストまたはイテレータ
+        """
+        rows = iter(data_list)
+        first_row = next(rows, None)
+        if first_row is not None:
+            data_list = itertools.chain([first_row], rows)
+        else:
             data_list = [{
                 'year': '',
                 'transit_walk_pop_coverage': '',
@@ -369,25 +299,32 @@ class PublicTransportMetricCalculator:
         )
 
     def export(self, file_path, data):
-        """エクスポート処理"""
+        """エクスポート処理
+
+        dataは行データ（辞書）のリストまたはイテレータ
+        """
         try:
-            if not data:
+            rows = iter(data)
+            first_row = next(rows, None)
+            if first_row is None:
                 raise Exception(self.tr("The data to export is empty."))
 
             # データ項目からヘッダーを取得
-            headers = list(data[0].keys())
+            headers = list(first_row.keys())
 
             # CSVファイル書き込み
             with open(
                 file_path, mode='w', newline='', encoding='utf-8'
             ) as csv_file:
-                writer = csv.DictWriter(csv_file, fieldnames=headers)
-                writer.writeheader()
-
-                for row in data:
-                    # 全値が空文字の行（ヘッダー定義用）はスキップ
-                    if any(v != '' for v in row.values()):
-                        writer.writerow(row)
+                writer = csv.writer(csv_file)
+                writer.writerow(headers)
+
+                # 全値が空文字の行（ヘッダー定義用）はスキップし、生成した順に書き込み
+                writer.writerows(
+                    [row.get(header, '') for header in headers]
+                    for row in itertools.chain([first_row], rows)
+                    if any(v != '' for v in row.values())
+                )
 
             msg = self.tr(
                 "File export completed: %1."
@@ -417,48 +354,142 @@ class PublicTransportMetricCalculator:
         else:
             return round(value, decimal_places)
 
-    def __extract(self, target_layer, buffer_layer):
-        """バッファレイヤ内に存在するフィーチャを抽出"""
-        # 空間インデックスの作成
-        processing.run("native:createspatialindex", {'INPUT': buffer_layer})
-
-        # バッファ内のフィーチャを抽出
-        result = processing.run(
-            "native:extractbylocation",
-            {
-                'INPUT': target_layer,
-                'PREDICATE': [6],  # within
-                'INTERSECT': buffer_layer,
-                'OUTPUT': 'TEMPORARY_OUTPUT',
-            },
-        )['OUTPUT']
-
-        return result
-
-    def __aggregate_sum(self, target_layer, sum_field, condition=None):
+    def __coverage_series(self, covered_pops, total_pops):
         """
-        条件に基づいて集計を行う
-        :param target_layer: 対象のレイヤ
-        :param sum_field: 集計するフィールド名
-        :param condition: フィルタリングする条件 (QgsExpression 形式の条件式)
-        :return: 集計結果
+        年度ごとのカバー率と前年度からの増減を計算
+        :param covered_pops: 年度ごとのカバー人口
+        :param total_pops: 年度ごとの総人口
+        :return: (カバー率のリスト, 増減のリスト)（算出できない値は'―'）
         """
-        # 条件がある場合はフィルタリング
-        if condition is not None:
-            # フィルタリングされたレイヤを作成
-            target_layer.setSubsetString(condition)
-
-        # 集計
-        result = target_layer.aggregate(
-            QgsAggregateCalculator.Aggregate.Sum, sum_field
+        covered = np.asarray(covered_pops, dtype=np.float64)
+        totals = np.asarray(total_pops, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = np.where(totals > 0, covered / totals, np.nan)
+
+        coverages = [
+            '―' if np.isnan(ratio) else self.round_or_na(float(ratio), 3)
+            for ratio in ratios
+        ]
+
+        # 丸めたカバー率の差分を一括で計算（初年度は前年度がないためNaN）
+        deltas = np.diff(
+            np.array(
+                [np.nan if coverage == '―' else coverage for coverage in coverages],
+                dtype=np.float64,
+            ),
+            prepend=np.nan,
         )
-        try:
-            result = int(result[0]) if result[0] is not None else 0
-        except (ValueError, TypeError):
-            result = 0
+        coverage_deltas = [
+            '―' if np.isnan(delta) else self.round_or_na(float(delta), 2)
+            for delta in deltas
+        ]
+        return coverages, coverage_deltas
 
-        # フィルタ解除
-        if condition is not None:
-            target_layer.setSubsetString('')
+    def __read_points(self, layer, field_indices):
+        """
+        フィーチャの重心の座標と集計するフィールドの値をx座標順に並べた配列で取得
+        :param layer: 対象のレイヤ
+        :param field_indices: 集計するフィールドのインデックスのリスト（-1のフィールドは0）
+        :return: (x座標, y座標, フィールドの値) の配列（重心がない場合の座標はNaN）
+        """
+        request = QgsFeatureRequest()
+        request.setSubsetOfAttributes([index for index in field_indices if index >= 0])
+
+        xs = []
+        ys = []
+        rows = []
+        for feature in layer.getFeatures(request):
+            centroid = feature.geometry().centroid() if feature.hasGeometry() else None
+            if centroid is not None and not centroid.isEmpty():
+                point = centroid.asPoint()
+                xs.append(point.x())
+                ys.append(point.y())
+            else:
+                xs.append(np.nan)
+                ys.append(np.nan)
+            attributes = feature.attributes()
+            rows.append([
+                self.__to_number(attributes[index]) if index >= 0 else 0.0
+                for index in field_indices
+            ])
+
+        xs = np.array(xs, dtype=np.float64)
+        values = np.array(rows, dtype=np.float64).reshape(len(rows), len(field_indices))
+
+        # NaNは末尾に並ぶため、範囲の検索では対象外となる
+        order = np.argsort(xs, kind='stable')
+        return (
+            xs[order],
+            np.array(ys, dtype=np.float64)[order],
+            values[order],
+        )
 
-        return result
+    def __read_geometries(self, layer, crs):
+        """
+        レイヤのジオメトリを指定の座標系で取得
+        :param layer: 対象のレイヤ
+        :param crs: 取得する座標系
+        :return: ジオメトリのリスト
+        """
+        request = QgsFeatureRequest().setNoAttributes()
+        request.setDestinationCrs(crs, QgsProject.instance().transformContext())
+        return [
+            feature.geometry()
+            for feature in layer.getFeatures(request)
+            if feature.hasGeometry()
+        ]
+
+    def __extract(self, points, geometries):
+        """
+        ジオメトリ内に存在するポイントのマスクを取得
+        :param points: __read_pointsで取得したポイントの配列
+        :param geometries: 判定するジオメトリ（バッファ等）のリスト
+        :return: ジオメトリ内（within）に存在するポイントを1とするマスク（np.uint8）
+        """
+        xs, ys, _ = points
+
+        mask = np.zeros(len(xs), dtype=np.uint8)
+        for geometry in geometries:
+            # ジオメトリの範囲内のポイントを候補として二分探索と配列演算でまとめて絞り込み
+            bounding_box = geometry.boundingBox()
+            start = np.searchsorted(xs, bounding_box.xMinimum(), side='left')
+            end = np.searchsorted(xs, bounding_box.xMaximum(), side='right')
+            in_range = (
+                (ys[start:end] >= bounding_box.yMinimum())
+                & (ys[start:end] <= bounding_box.yMaximum())
+            )
+            candidates = np.flatnonzero(in_range) + start
+            # 判定済みのポイントは省略
+            candidates = candidates[mask[candidates] == 0]
+            if candidates.size == 0:
+                continue
+
+            # 候補のみ準備済みジオメトリ（PreparedGeometry）で厳密に判定
+            engine = QgsGeometry.createGeometryEngine(geometry.constGet())
+            engine.prepareGeometry()
+            for i in candidates:
+                if engine.contains(QgsPoint(xs[i], ys[i])):
+                    mask[i] = 1
+
+        return mask
+
+    def __sum_by_masks(self, values, masks):
+        """
+        フィールドごとの合計を、マスクごとに集計する
+        :param values: フィーチャ×フィールドの値の配列
+        :param masks: 集計対象を1とするマスク（np.uint8）のリスト（Noneの場合は全フィーチャ）
+        :return: masksの順に、フィールドごとの集計結果のリスト
+        """
+        results = []
+        for mask in masks:
+            sums = values.sum(axis=0) if mask is None else mask @ values
+            results.append([int(value) for value in sums])
+        return results
+
+    def __to_number(self, value):
+        """属性値を数値に変換（NULLや数値以外は0）"""
+        try:
+            number = float(value)
+        except (ValueError, TypeError):
+            return 0.0
+        return number if np.isfinite(number) else 0.0
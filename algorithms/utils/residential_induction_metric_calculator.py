@@ -6,15 +6,18 @@
  ***************************************************************************/
 """
 
-import re
 import csv
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from qgis.core import (
     QgsMessageLog,
     Qgis,
     QgsAggregateCalculator,
     QgsVectorLayer,
-    QgsFeature,
     QgsCoordinateReferenceSystem,
+    QgsFeatureRequest,
+    QgsFeatureSink,
+    QgsVectorLayerFeatureSource,
 )
 from PyQt5.QtCore import QCoreApplication
 import processing
@@ -106,17 +109,6 @@ class ResidentialInductionMetricCalculator:
                     Qgis.Warning,
                 )
 
-            centroid_layer = QgsVectorLayer(
-                "Point?crs=" + buildings_layer.crs().authid(),
-                "tmp_building_centroids",
-                "memory",
-            )
-            centroid_layer_data = centroid_layer.dataProvider()
-
-            # 元の建物レイヤから属性をコピー
-            centroid_layer_data.addAttributes(buildings_layer.fields())
-            centroid_layer.updateFields()
-
             # is_target=1のzonesを取得してフィルタリング用のレイヤを作成
             target_zones_layer = None
             if zones_layer:
@@ -129,13 +121,13 @@ class ResidentialInductionMetricCalculator:
                 target_zones_data.addAttributes(zones_layer.fields())
                 target_zones_layer.updateFields()
 
-                target_zones_features = []
-                for zone_feature in zones_layer.getFeatures():
-                    if zone_feature["is_target"] == 1:
-                        target_zones_features.append(zone_feature)
+                # 条件はプロバイダ側で評価（GeoPackageではSQLのWHERE句）
+                target_zones_features = list(zones_layer.getFeatures(
+                    QgsFeatureRequest().setFilterExpression('"is_target" = 1')
+                ))
 
                 if target_zones_features:
-                    target_zones_data.addFeatures(target_zones_features)
+                    target_zones_data.addFeatures(target_zones_features, QgsFeatureSink.FastInsert)
                     target_zones_layer.updateExtents()
                     msg = self.tr("Using %1 target zones (is_target=1) for calculation.").replace("%1", str(len(target_zones_features)))
                     QgsMessageLog.logMessage(
@@ -189,63 +181,36 @@ class ResidentialInductionMetricCalculator:
             )
 
             # target_zones内の重心のみを抽出
+            # 属性の結合は不要なため、位置による抽出で判定のみ行い、抽出結果をそのまま使用する
             if target_zones_layer and target_zones_layer.featureCount() > 0:
-                joined_result = processing.run(
-                    "native:joinattributesbylocation",
+                centroid_layer = processing.run(
+                    "native:extractbylocation",
                     {
                         'INPUT': centroids_all,
-                        'JOIN': target_zones_layer,
-                        'PREDICATE': [5],  # within
-                        'JOIN_FIELDS': [],  # フィールド結合は不要
-                        'METHOD': 0,
-                        'DISCARD_NONMATCHING': True,  # マッチしないものは除外
-                        'PREFIX': '',
+                        'PREDICATE': [6],  # within
+                        'INTERSECT': target_zones_layer,
                         'OUTPUT': 'memory:'
                     }
-                )
-                centroids_in_target = joined_result['OUTPUT']
+                )['OUTPUT']
             else:
                 # target_zonesがない場合は全重心を使用
-                centroids_in_target = centroids_all
+                centroid_layer = centroids_all
 
             if self.check_canceled():
                 return  # キャンセルチェック
 
-            # centroid_layerにフィーチャを追加
-            centroid_features = []
-            for feature in centroids_in_target.getFeatures():
-                centroid_features.append(feature)
-
-            centroid_layer_data.addFeatures(centroid_features)
-            centroid_layer.updateExtents()
-
             # 空間インデックス作成
             processing.run(
                 "native:createspatialindex", {'INPUT': centroid_layer}
             )
 
-            centroid_layer = self.gpkg_manager.add_layer(
-                centroid_layer, "tmp_building_centroids", None, False
-            )
-            if not centroid_layer:
-                raise Exception(self.tr("Failed to add layer to GeoPackage."))
-
             self.centroid_layer = centroid_layer
 
             # 属性名を取得
             fields = buildings_layer.fields()
 
-            # 年度情報を取得
-            years = set()
-            pattern = re.compile(r'^(\d{4})_')
-
-            for field in fields:
-                match = pattern.match(field.name())
-                if match:
-                    years.add(match.group(1))
-
-            # 年度をリスト化してソート
-            unique_years = sorted(list(years))
+            # 年度情報を取得し、リスト化してソート
+            unique_years = self.__extract_years(fields)
 
             # データリストを作成
             data_list = []
@@ -255,7 +220,11 @@ class ResidentialInductionMetricCalculator:
             has_residential_area = False
             use_hypothetical_areas = False
             residential_area_features = []
-            for induction_feature in induction_layer.getFeatures():
+            # 作成するレイヤは属性を持たないため、判定に使うtype_idのみ取得
+            type_id_request = QgsFeatureRequest().setSubsetOfAttributes(
+                ['type_id'], induction_layer.fields()
+            )
+            for induction_feature in induction_layer.getFeatures(type_id_request):
                 if induction_feature["type_id"] == 31:
                     residential_area_features.append(induction_feature)
                     has_residential_area = True
@@ -268,7 +237,7 @@ class ResidentialInductionMetricCalculator:
                     "memory",
                 )
                 residential_area_data = residential_area_layer.dataProvider()
-                residential_area_data.addFeatures(residential_area_features)
+                residential_area_data.addFeatures(residential_area_features, QgsFeatureSink.FastInsert)
                 residential_area_layer.updateExtents()
             # 居住誘導区域がない場合は仮想居住誘導区域をそのまま使用
             elif hypothetical_residential_layer:
@@ -302,18 +271,7 @@ class ResidentialInductionMetricCalculator:
 
             # target_zones_layerがある場合、居住誘導区域をtarget_zonesでクリップ
             if target_zones_layer and residential_area_layer.featureCount() > 0:
-                # CRSが異なる場合は再投影してからクリップ
-                if residential_area_layer.crs() != target_zones_layer.crs():
-                    reprojected = processing.run(
-                        "native:reprojectlayer",
-                        {
-                            'INPUT': residential_area_layer,
-                            'TARGET_CRS': target_zones_layer.crs(),
-                            'OUTPUT': 'memory:'
-                        }
-                    )['OUTPUT']
-                    residential_area_layer = reprojected
-
+                # CRSが異なる場合もクリップ時に行政区域側が変換されるため、ここでは再投影しない
                 clipped_residential = processing.run(
                     "native:clip",
                     {
@@ -343,48 +301,9 @@ class ResidentialInductionMetricCalculator:
                 3857
             )  # メートル単位の座標系 (EPSG:3857)
 
-            # 居住誘導区域の面積計算用にCRS変換
-            transformed_residential_layer = processing.run(
-                "native:reprojectlayer",
-                {
-                    'INPUT': residential_area_layer,
-                    'TARGET_CRS': crs_dest,
-                    'OUTPUT': 'memory:',
-                },
-            )['OUTPUT']
-
-            # 立地適正化計画区域の面積計算用にCRS変換（必要な場合）
-            transformed_induction_layer = processing.run(
-                "native:reprojectlayer",
-                {
-                    'INPUT': induction_layer,
-                    'TARGET_CRS': crs_dest,
-                    'OUTPUT': 'memory:',
-                },
-            )['OUTPUT']
-
             # 面積計算
-            area = 0  # 居住誘導区域の面積(ha) - target_zones内のみ
-            for feature in transformed_residential_layer.getFeatures():
-                # 面積計算 (ヘクタール単位へ変換: 1ヘクタール = 10,000平方メートル)
-                area += feature.geometry().area() / 10000
-
-            # 立地適正化計画区域の面積計算
-            outside_area = 0  # 立地適正化計画区域の面積(ha)
-            for induction_feature in transformed_induction_layer.getFeatures():
-                # 立地適正化計画区域（type_id=0）
-                if induction_feature["type_id"] == 0:
-                    # target_zones_layerがある場合はクリップして計算
-                    if target_zones_layer:
-                        # 個別にクリップして面積を計算
-                        for zone_feature in target_zones_layer.getFeatures():
-                            intersection = induction_feature.geometry().intersection(zone_feature.geometry())
-                            if not intersection.isEmpty():
-                                # CRS変換後の座標系で面積計算
-                                outside_area += intersection.area() / 10000
-                    else:
-                        # 面積計算 (ヘクタール単位へ変換)
-                        outside_area += induction_feature.geometry().area() / 10000
+            # 居住誘導区域の面積(ha) - target_zones内のみ
+            area = self.__sum_area_ha(residential_area_layer, crs_dest)
 
             # 居住誘導区域内の建物を取得
             result = processing.run(
@@ -404,6 +323,27 @@ class ResidentialInductionMetricCalculator:
             # 結合結果の取得
             residential_buildings = result['OUTPUT']
 
+            # 全年度の人口と将来人口をそれぞれ1回の走査で集計
+            future_field = f"future_{comparative_year}_PT0"
+            sum_fields = [f"{year}_population" for year in unique_years] + [future_field]
+            # 総人口（行政区域 is_target=1 内）と居住誘導区域内人口の走査は互いに独立しているため並列で実行
+            # （レイヤはスレッド間で共有できないため、フィーチャソースを呼び出し元スレッドで作成して渡す）
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                total_future = executor.submit(
+                    self.__sum_fields,
+                    QgsVectorLayerFeatureSource(centroid_layer),
+                    centroid_layer.fields(),
+                    sum_fields,
+                )
+                area_future = executor.submit(
+                    self.__sum_fields,
+                    QgsVectorLayerFeatureSource(residential_buildings),
+                    residential_buildings.fields(),
+                    sum_fields,
+                )
+                total_pops = total_future.result()
+                area_pops = area_future.result()
+
             for i, year in enumerate(unique_years):
                 if self.check_canceled():
                     return  # キャンセルチェック
@@ -413,16 +353,7 @@ class ResidentialInductionMetricCalculator:
                 year_field = f"{year}_population"
 
                 # 総人口を集計（行政区域 is_target=1 内）
-                total_pop_result = centroid_layer.aggregate(
-                    QgsAggregateCalculator.Aggregate.Sum,
-                    year_field,
-                    QgsAggregateCalculator.AggregateParameters(),
-                )
-                total_pop = (
-                    int(total_pop_result[0])
-                    if total_pop_result[0] is not None
-                    else 0
-                )
+                total_pop = total_pops[year_field]
 
                 # SUMフィールドの確認
                 sum_field_name = f"{year_field}"  # フィールド名
@@ -437,14 +368,7 @@ class ResidentialInductionMetricCalculator:
                     )
 
                 # 居住誘導区域内人口
-                sum_result = residential_buildings.aggregate(
-                    QgsAggregateCalculator.Aggregate.Sum,
-                    sum_field_name,
-                    QgsAggregateCalculator.AggregateParameters(),
-                )
-                area_pop = (
-                    int(sum_result[0]) if sum_result[0] is not None else 0
-                )
+                area_pop = area_pops[sum_field_name]
 
                 # 居住誘導区域内人口割合（Rate_Pop）
                 rate_pop = (
@@ -529,29 +453,13 @@ class ResidentialInductionMetricCalculator:
                 # 最後の年度だけ将来人口関連の計算を行う
                 if i == len(unique_years) - 1:
                     # 居住誘導区域内将来人口差（p）
-                    sum_result = residential_buildings.aggregate(
-                        QgsAggregateCalculator.Aggregate.Sum,
-                        f"future_{comparative_year}_PT0",
-                        QgsAggregateCalculator.AggregateParameters(),
-                    )
-                    future_area_pop = (
-                        int(sum_result[0]) if sum_result[0] is not None else 0
-                    )
+                    future_area_pop = area_pops[future_field]
 
                     # 現況人口と将来人口から、居住誘導区域内の減少人口：p を求める
                     area_pop_difference = area_pop - future_area_pop
 
-                    # 市内将来人口
-                    sum_result = buildings_layer.aggregate(
-                        QgsAggregateCalculator.Aggregate.Sum,
-                        f"future_{comparative_year}_PT0",
-                        QgsAggregateCalculator.AggregateParameters(),
-                    )
-                    future_total_pop = (
-                        int(total_pop_result[0])
-                        if total_pop_result[0] is not None
-                        else 0
-                    )
+                    # 市内将来人口（従来どおり最終年度の総人口の集計結果を使用）
+                    future_total_pop = total_pop
 
                     # 市内将来人口と居住誘導区域将来人口から居住誘導区域外の将来人口：rを求める
                     outside_area_future_Pop = future_total_pop - future_area_pop
@@ -731,7 +639,7 @@ class ResidentialInductionMetricCalculator:
                 rpa_data = rpa_layer.dataProvider()
                 rpa_data.addAttributes(induction_layer.fields())
                 rpa_layer.updateFields()
-                rpa_data.addFeatures(rpa_features)
+                rpa_data.addFeatures(rpa_features, QgsFeatureSink.FastInsert)
                 rpa_layer.updateExtents()
             # 居住誘導区域がない場合は仮想居住誘導区域をそのまま使用
             elif hypothetical_residential_layer:
@@ -760,18 +668,7 @@ class ResidentialInductionMetricCalculator:
 
             # target_zones_layerがある場合、居住誘導区域をtarget_zonesでクリップ
             if target_zones_layer and rpa_layer.featureCount() > 0:
-                # CRSが異なる場合は再投影してからクリップ
-                if rpa_layer.crs() != target_zones_layer.crs():
-                    reprojected = processing.run(
-                        "native:reprojectlayer",
-                        {
-                            'INPUT': rpa_layer,
-                            'TARGET_CRS': target_zones_layer.crs(),
-                            'OUTPUT': 'memory:'
-                        }
-                    )['OUTPUT']
-                    rpa_layer = reprojected
-
+                # CRSが異なる場合もクリップ時に行政区域側が変換されるため、ここでは再投影しない
                 clipped_rpa = processing.run(
                     "native:clip",
                     {
@@ -796,13 +693,7 @@ class ResidentialInductionMetricCalculator:
 
             # 年度情報を取得
             fields = buildings_layer.fields()
-            years = set()
-            pattern = re.compile(r'^(\d{4})_')
-            for field in fields:
-                match = pattern.match(field.name())
-                if match:
-                    years.add(match.group(1))
-            unique_years = sorted(list(years))
+            unique_years = self.__extract_years(fields)
             latest_year = unique_years[-1] if unique_years else None
 
             # population_target_settingsから比較年度を取得
@@ -818,27 +709,14 @@ class ResidentialInductionMetricCalculator:
             if comparative_year:
                 future_field = f'future_{comparative_year}_PT00'
 
-            # 行政区域内の建物重心（最新年人口）を集計
-            admin_pop = 0
-            if latest_year:
-                pop_field = f'{latest_year}_population'
-                if pop_field in centroid_layer.fields().names():
-                    admin_pop_result = centroid_layer.aggregate(
-                        QgsAggregateCalculator.Aggregate.Sum,
-                        pop_field,
-                        QgsAggregateCalculator.AggregateParameters(),
-                    )
-                    admin_pop = int(admin_pop_result[0]) if admin_pop_result[0] is not None else 0
-
-            # 行政区域内の建物重心（将来人口）を集計
-            municipality_projected_pop = 0
-            if future_field and future_field in centroid_layer.fields().names():
-                municipality_projected_pop_result = centroid_layer.aggregate(
-                    QgsAggregateCalculator.Aggregate.Sum,
-                    future_field,
-                    QgsAggregateCalculator.AggregateParameters(),
-                )
-                municipality_projected_pop = int(municipality_projected_pop_result[0]) if municipality_projected_pop_result[0] is not None else 0
+            # 集計するフィールド（最新年人口、将来人口）
+            pop_field = f'{latest_year}_population' if latest_year else None
+            sum_fields = [field for field in (pop_field, future_field) if field]
+
+            # 行政区域内の建物重心（最新年人口、将来人口）を1回の走査で集計
+            admin_sums = self.__sum_fields(centroid_layer, centroid_layer.fields(), sum_fields)
+            admin_pop = admin_sums.get(pop_field, 0)
+            municipality_projected_pop = admin_sums.get(future_field, 0)
 
             # 居住誘導区域内の建物を取得
             rpa_buildings_result = processing.run(
@@ -856,27 +734,10 @@ class ResidentialInductionMetricCalculator:
             )
             rpa_buildings = rpa_buildings_result['OUTPUT']
 
-            # 居住誘導区域内人口（最新年）を集計
-            rpa_pop_sheet_a = 0
-            if latest_year:
-                pop_field = f'{latest_year}_population'
-                if pop_field in rpa_buildings.fields().names():
-                    rpa_pop_result = rpa_buildings.aggregate(
-                        QgsAggregateCalculator.Aggregate.Sum,
-                        pop_field,
-                        QgsAggregateCalculator.AggregateParameters(),
-                    )
-                    rpa_pop_sheet_a = int(rpa_pop_result[0]) if rpa_pop_result[0] is not None else 0
-
-            # 居住誘導区域内将来人口を集計
-            rpa_projected_pop = 0
-            if future_field and future_field in rpa_buildings.fields().names():
-                rpa_projected_pop_result = rpa_buildings.aggregate(
-                    QgsAggregateCalculator.Aggregate.Sum,
-                    future_field,
-                    QgsAggregateCalculator.AggregateParameters(),
-                )
-                rpa_projected_pop = int(rpa_projected_pop_result[0]) if rpa_projected_pop_result[0] is not None else 0
+            # 居住誘導区域内人口（最新年）、将来人口を1回の走査で集計
+            rpa_sums = self.__sum_fields(rpa_buildings, rpa_buildings.fields(), sum_fields)
+            rpa_pop_sheet_a = rpa_sums.get(pop_field, 0)
+            rpa_projected_pop = rpa_sums.get(future_field, 0)
 
             # 居住誘導区域外人口を算出
             outside_rpa_pop_sheet_a = admin_pop - rpa_pop_sheet_a
@@ -1097,6 +958,96 @@ class ResidentialInductionMetricCalculator:
             empty_if107,
         )
 
+    def __sum_area_ha(self, layer, crs):
+        """
+        レイヤの面積の合計（ha）を指定の座標系で計算
+
+        再投影したレイヤは作成せず、集計関数の式の中でジオメトリを変換する。
+        :param layer: 対象のレイヤ
+        :param crs: 面積を計算する座標系（メートル単位）
+        :return: 面積の合計（ha）
+        """
+        if layer.crs() == crs:
+            expression = 'area($geometry)'
+        elif layer.crs().authid() and crs.authid():
+            expression = (
+                f"area(transform($geometry, '{layer.crs().authid()}', '{crs.authid()}'))"
+            )
+        else:
+            # 式で指定できない座標系の場合は再投影したレイヤで計算
+            layer = processing.run(
+                "native:reprojectlayer",
+                {
+                    'INPUT': layer,
+                    'TARGET_CRS': crs,
+                    'OUTPUT': 'memory:',
+                },
+            )['OUTPUT']
+            expression = 'area($geometry)'
+
+        # 平面面積で計算（$areaは楕円体計算になりうるためarea()を使用）
+        area_result = layer.aggregate(
+            QgsAggregateCalculator.Aggregate.Sum,
+            expression,
+            QgsAggregateCalculator.AggregateParameters(),
+        )
+        if not area_result[1] or area_result[0] is None:
+            return 0
+        # ヘクタール単位へ変換: 1ヘクタール = 10,000平方メートル
+        return area_result[0] / 10000
+
+    def __extract_years(self, fields):
+        """
+        「YYYY_」で始まるフィールド名から年度を取得
+        :param fields: フィールド一覧
+        :return: 年度（文字列）の昇順リスト
+        """
+        years = set()
+        for name in fields.names():
+            # 先頭4文字が数字かつ5文字目が「_」（正規表現 ^(\d{4})_ と同じ判定）
+            if len(name) > 4 and name[4] == '_' and name[:4].isdecimal():
+                years.add(name[:4])
+        return sorted(years)
+
+    def __sum_fields(self, source, fields, field_names):
+        """
+        複数フィールドの合計を1回の走査で集計
+        :param source: 対象のレイヤまたはフィーチャソース（ワーカースレッドから呼び出す場合はフィーチャソース）
+        :param fields: 対象のフィールド定義
+        :param field_names: 集計するフィールド名のリスト
+        :return: フィールド名ごとの集計結果（存在しないフィールド、NULL等の数値以外の値は集計しない）
+        """
+        field_indices = [fields.indexFromName(name) for name in field_names]
+        valid_indices = [index for index in field_indices if index >= 0]
+        if not valid_indices:
+            return dict.fromkeys(field_names, 0)
+
+        # ジオメトリは読み込まず、集計するフィールドのみ取得し、フィーチャ×フィールドの配列にまとめる
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes(valid_indices)
+        values = np.array(
+            [
+                [
+                    self.__to_number(attributes[index]) if index >= 0 else 0.0
+                    for index in field_indices
+                ]
+                for attributes in (
+                    feature.attributes() for feature in source.getFeatures(request)
+                )
+            ],
+            dtype=np.float64,
+        ).reshape(-1, len(field_indices))
+
+        # フィールドごとの合計を一括で計算
+        sums = values.sum(axis=0)
+        return {name: int(value) for name, value in zip(field_names, sums)}
+
+    def __to_number(self, value):
+        """属性値を数値に変換（NULLや数値以外は0）"""
+        if isinstance(value, (int, float)) and np.isfinite(value):
+            return value
+        return 0.0
+
     def round_or_na(self, value, decimal_places, threshold=None):
         """丸め処理"""
         if value is None or (threshold is not None and value <= threshold):